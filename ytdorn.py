@@ -6,71 +6,140 @@ Advanced CLI tool for comprehensive YouTube content downloading with modern UI
 """
 
 import sys
-import platform
-import subprocess
 import os
 import json
-import asyncio
-import concurrent.futures
-from typing import Dict, Any, Optional, List, Tuple
-import shutil
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Sequence
+from collections import OrderedDict
 import time
 import threading
+import functools
+import importlib.util
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import operator
 from pathlib import Path
 import signal
 import re
+import select
 import argparse
+import atexit
 from urllib.parse import urlparse, parse_qs
-import logging
+
+try:
+    import orjson # Optional: faster config parsing and writing
+except ImportError:
+    orjson = None
+
+# Characters gradient_text leaves uncoloured
+_GRADIENT_SKIP_CHARS = frozenset('\r\n\t ')
+
+try:
+    _STDOUT_IS_TTY = sys.stdout.isatty()
+except (AttributeError, ValueError): # No usable stdout (e.g. pythonw, closed stream)
+    _STDOUT_IS_TTY = False
+
+# Colour only on a terminal, and never when NO_COLOR is set (https://no-color.org)
+_USE_COLOR = _STDOUT_IS_TTY and not os.environ.get('NO_COLOR')
+
+def _c(code: str) -> str:
+    """Return an ANSI style code, or '' when colour output is off"""
+    return code if _USE_COLOR else ''
 
 class Colors:
     """Enhanced color management with modern terminal styling"""
     # Core colors
-    PRIMARY = '\033[38;2;64;224;255m'      # Bright cyan
-    SECONDARY = '\033[38;2;255;100;255m'   # Bright magenta
-    SUCCESS = '\033[38;2;0;255;127m'       # Bright green
-    WARNING = '\033[38;2;255;191;0m'       # Bright yellow
-    ERROR = '\033[38;2;255;69;58m'         # Bright red
-    INFO = '\033[38;2;175;175;255m'        # Light blue
-    MUTED = '\033[38;2;128;128;128m'       # Gray
+    PRIMARY = _c('\033[38;2;64;224;255m')      # Bright cyan
+    SECONDARY = _c('\033[38;2;255;100;255m')   # Bright magenta
+    SUCCESS = _c('\033[38;2;0;255;127m')       # Bright green
+    WARNING = _c('\033[38;2;255;191;0m')       # Bright yellow
+    ERROR = _c('\033[38;2;255;69;58m')         # Bright red
+    INFO = _c('\033[38;2;175;175;255m')        # Light blue
+    MUTED = _c('\033[38;2;128;128;128m')       # Gray
 
     # Text styles
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    ITALIC = '\033[3m'
-    UNDERLINE = '\033[4m'
-    RESET = '\033[0m'
+    BOLD = _c('\033[1m')
+    DIM = _c('\033[2m')
+    ITALIC = _c('\033[3m')
+    UNDERLINE = _c('\033[4m')
+    RESET = _c('\033[0m')
 
     # Special effects
-    GLOW = '\033[5m'
-    REVERSE = '\033[7m'
+    GLOW = _c('\033[5m')
+    REVERSE = _c('\033[7m')
 
     @staticmethod
     def rgb(r: int, g: int, b: int) -> str:
-        return f'\033[38;2;{r};{g};{b}m'
+        return f'\033[38;2;{r};{g};{b}m' if _USE_COLOR else ''
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _gradient_escapes(count: int, color1: Tuple[int, int, int],
+                          color2: Tuple[int, int, int]) -> Tuple[str, ...]:
+        """Precompute the colour escape for each of `count` gradient steps"""
+        r1, g1, b1 = color1
+        dr, dg, db = color2[0] - r1, color2[1] - g1, color2[2] - b1
+        last = max(count - 1, 1)
+        escapes = []
+        for i in range(count):
+            progress = i / last
+            escapes.append(f'\033[38;2;{int(r1 + dr * progress)};{int(g1 + dg * progress)};{int(b1 + db * progress)}m')
+        return tuple(escapes)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
     def gradient_text(text: str, color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> str:
         """Create smooth color gradient across text"""
-        if not text.strip():
+        if not _USE_COLOR or not text.strip():
             return text
 
-        result = ""
-        text_length = len([c for c in text if c.strip('\r\n\t ')]) # More robust stripping for length
-        char_index = 0
-
-        for char in text:
-            if char.strip('\r\n\t '):
-                progress = char_index / max(text_length - 1, 1)
-                r = int(color1[0] + (color2[0] - color1[0]) * progress)
-                g = int(color1[1] + (color2[1] - color1[1]) * progress)
-                b = int(color1[2] + (color2[2] - color1[2]) * progress)
-                result += Colors.rgb(r, g, b) + char
-                char_index += 1
-            else:
-                result += char
-        return result + Colors.RESET
+        skip = _GRADIENT_SKIP_CHARS
+        text_length = sum(1 for c in text if c not in skip)
+        escapes = iter(Colors._gradient_escapes(text_length, color1, color2))
+        return "".join(c if c in skip else next(escapes) + c for c in text) + Colors.RESET
+
+# Progress/spinner frames go straight to the terminal's file descriptor: one write(2) per
+# frame without the TextIOWrapper encode + flush round trip. Falls back to sys.stdout when
+# stdout is not a real terminal (pipes, redirection, captured output) and on Windows, where
+# the console code page is often not UTF-8 and only sys.stdout encodes for it.
+try:
+    _STDOUT_FD = sys.stdout.fileno()
+    _USE_RAW_STDOUT = _STDOUT_IS_TTY and os.name == 'posix'
+    _STDOUT_ENCODING = sys.stdout.encoding or 'utf-8' # Same bytes sys.stdout would write
+except (AttributeError, OSError, ValueError):
+    _STDOUT_FD = -1
+    _USE_RAW_STDOUT = False
+    _STDOUT_ENCODING = 'utf-8'
+
+# Terminal control sequences: erase the whole current line, hide/show the cursor
+# (cursor control is not colour, so NO_COLOR doesn't turn these off; pipes get none)
+_CLEAR_LINE = '\033[2K' if _STDOUT_IS_TTY else ''
+_HIDE_CURSOR = '\033[?25l'
+_SHOW_CURSOR = '\033[?25h'
+
+def _emit(text: str, droppable: bool = False):
+    """Write a progress/spinner frame to stdout immediately.
+
+    A droppable frame is skipped when the terminal can't take more output right now
+    (slow ssh/tmux); the next redraw replaces it anyway, so downloads never wait on it.
+    """
+    if _USE_RAW_STDOUT:
+        if droppable:
+            try:
+                _, writable, _ = select.select((), (_STDOUT_FD,), (), 0)
+            except (OSError, ValueError):
+                writable = True # Can't tell; just write
+            if not writable:
+                return
+        data = text.encode(_STDOUT_ENCODING, 'replace')
+        while data: # os.write may write only part of the buffer
+            data = data[os.write(_STDOUT_FD, data):]
+    else:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+if _USE_RAW_STDOUT:
+    # Never leave the terminal with a hidden cursor, e.g. after Ctrl+C mid-spinner
+    atexit.register(_emit, _SHOW_CURSOR)
 
 class ModernSpinner:
     """Advanced spinner with multiple animation styles"""
@@ -90,18 +159,25 @@ class ModernSpinner:
 
     def animate(self):
         """Run the spinner animation"""
-        frame_index = 0
-        while not self.stop_event.is_set():
-            frame = self.frames[frame_index % len(self.frames)]
-            sys.stdout.write(f'\r{Colors.PRIMARY}{frame}{Colors.RESET} {self.message}')
-            sys.stdout.flush()
-            time.sleep(0.1)
-            frame_index += 1
+        primary, reset = Colors.PRIMARY, Colors.RESET
+        frames = itertools.cycle(self.frames)
+        # Draw immediately, then every 0.1s; wait() returns as soon as stop() sets the event
+        while True:
+            _emit(f'\r{_CLEAR_LINE}{primary}{next(frames)}{reset} {self.message}', droppable=True)
+            if self.stop_event.wait(0.1):
+                break
 
     def start(self, message: str):
         """Start spinner with message"""
         self.message = message
         self.stop_event.clear()
+        if not _STDOUT_IS_TTY:
+            # Nobody sees the animation when piped/redirected; skip the thread and note the
+            # message once on stderr so stdout stays clean (e.g. --info JSON)
+            self.thread = None
+            print(message, file=sys.stderr)
+            return
+        _emit(_HIDE_CURSOR) # No blinking cursor after the frame while animating
         self.thread = threading.Thread(target=self.animate, daemon=True)
         self.thread.start()
 
@@ -110,108 +186,109 @@ class ModernSpinner:
         self.stop_event.set()
         if self.thread:
             self.thread.join()
-        sys.stdout.write('\r\033[K') # Clear the spinner line
-        if final_message:
+            self.thread = None
+            # Clear the spinner line, restore the cursor and show the final message in one write
+            _emit(f"\r{_CLEAR_LINE}{_SHOW_CURSOR}{final_message}\n" if final_message
+                  else f"\r{_CLEAR_LINE}{_SHOW_CURSOR}")
+        elif final_message:
             print(final_message)
 
+# Byte size units used by AdvancedProgressBar._format_bytes
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Progress line: description, bar, percentage, current size, total size, speed, ETA
+_BAR_TMPL = f"\r{_CLEAR_LINE}{Colors.PRIMARY}▶{Colors.RESET} %s [%s] %5.1f%% (%s/%s)%s ETA: %s "
+
 class AdvancedProgressBar:
     """Modern progress bar with detailed statistics"""
 
+    SPEED_SAMPLE_INTERVAL = 0.5 # Seconds between speed samples
+    SPEED_EMA_ALPHA = 0.3 # Weight of the newest sample in the smoothed speed
+
     def __init__(self, total: int, description: str = "", width: int = 40):
         self.total = total
         self.description = description
         self.width = width
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.current = 0
-        self.speed_samples: List[Tuple[float, int]] = [] # time, bytes
-        self.last_update = time.time()
+        self._ema_speed = 0.0 # Smoothed bytes/sec, 0 until the first sample
+        self._last_bytes = 0
+        self._last_time = self.start_time
+        # Speed/ETA strings and the EMA sample time they were formatted for
+        self._speed_str = ""
+        self._eta_str = "--:--"
+        self._fmt_time = -1.0
+        # Parts of the progress line that never change for this bar
+        self._desc30 = f"{description[:30]:<30}"
+        self._total_fmt = self._format_bytes(float(total))
 
-    def update(self, current: int, extra_info: str = "") -> str:
-        """Update progress with enhanced statistics"""
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _bar_strings(width: int) -> Tuple[str, ...]:
+        """Fully rendered bars for 0..width filled cells"""
+        cells = [Colors.rgb(min(255, 50 + (i * 205 // width)), 100, 255) + '█' for i in range(width)]
+        bars = []
+        for filled in range(width + 1):
+            bar = ''.join(cells[:filled])
+            if filled < width:
+                bar += Colors.MUTED + '░' * (width - filled)
+            bars.append(bar + Colors.RESET)
+        return tuple(bars)
+
+    def update(self, current: int, extra_info: str = "", now: Optional[float] = None) -> str:
+        """Update progress with enhanced statistics (`now` is a time.monotonic() reading)"""
         self.current = current
-        now = time.time()
-
-        # Calculate speed with smoothing
-        if now - self.last_update > 0.5:  # Update speed every 0.5 seconds
-            if self.speed_samples: # Ensure there's a previous sample to compare against
-                # Speed = (change in bytes) / (change in time)
-                # Only add if current > previous sample bytes to avoid negative speed on retries/corrections
-                if current > self.speed_samples[-1][1] and now > self.speed_samples[-1][0]:
-                     speed = (current - self.speed_samples[-1][1]) / (now - self.speed_samples[-1][0])
-                     self.speed_samples.append((now, current, speed)) # Store time, current_bytes, speed
-                elif now > self.start_time: # Fallback if something is odd with samples
-                     speed = current / (now - self.start_time)
-                     self.speed_samples.append((now, current, speed))
-            elif now > self.start_time: # First sample or restart
-                speed = current / (now - self.start_time)
-                self.speed_samples.append((now, current, speed)) # Store time, current_bytes, speed
-            
-            if len(self.speed_samples) > 10:  # Keep last 10 samples
-                self.speed_samples.pop(0)
-            self.last_update = now
-
+        if now is None:
+            now = time.monotonic()
+
+        # Exponential moving average of the speed, resampled every SPEED_SAMPLE_INTERVAL
+        dt = now - self._last_time
+        if dt > self.SPEED_SAMPLE_INTERVAL:
+            delta = current - self._last_bytes
+            if delta >= 0: # Byte count can go backwards on retries/corrections; just rebase then
+                instant = delta / dt
+                alpha = self.SPEED_EMA_ALPHA
+                self._ema_speed = alpha * instant + (1 - alpha) * self._ema_speed if self._ema_speed else instant
+            self._last_bytes = current
+            self._last_time = now
 
         # Calculate percentage and bar
         percentage = (current / self.total * 100) if self.total > 0 else 0
         filled = int(self.width * current / self.total) if self.total > 0 else 0
 
-        # Create modern progress bar with gradient
-        bar = ''
-        for i in range(filled):
-            intensity = min(255, 50 + (i * 205 // self.width))
-            bar += Colors.rgb(intensity, 100, 255) + '█'
-
-        if filled < self.width:
-            bar += Colors.MUTED + '░' * (self.width - filled)
-        bar += Colors.RESET
-
-        # Calculate ETA
-        elapsed = now - self.start_time
-        eta_seconds = 0
-        if self.speed_samples and self.total > 0 and current > 0:
-            # Use average speed from recent samples for ETA
-            recent_speeds = [s[2] for s in self.speed_samples if len(s) > 2 and s[2] > 0]
-            if recent_speeds:
-                avg_speed = sum(recent_speeds) / len(recent_speeds)
-                if avg_speed > 0:
-                    eta_seconds = (self.total - current) / avg_speed
-        elif current > 0 and elapsed > 0 and self.total > 0: # Fallback if no speed samples
-             rate = current / elapsed
-             if rate > 0:
-                 eta_seconds = (self.total - current) / rate
-
-        eta = self._format_duration(eta_seconds) if eta_seconds > 0 else "--:--"
-
-
-        # Format sizes
+        # Modern progress bar with gradient, prebuilt for every fill level
+        bar = self._bar_strings(self.width)[min(filled, self.width)]
+
         current_size = self._format_bytes(float(current))
-        total_size = self._format_bytes(float(self.total))
-
-        # Get current speed
-        current_speed_str = ""
-        if self.speed_samples and len(self.speed_samples[-1]) > 2:
-            # Use the latest calculated speed
-            speed_val = self.speed_samples[-1][2]
-            if speed_val > 0:
-                 current_speed_str = f" @ {self._format_bytes(speed_val)}/s"
-        elif extra_info: # Fallback to yt-dlp provided speed if available
-            current_speed_str = extra_info
 
+        if self._ema_speed > 0:
+            # Speed and ETA only change when the EMA is resampled; reuse their strings in between
+            if self._fmt_time != self._last_time:
+                self._speed_str = f" @ {self._format_bytes(self._ema_speed)}/s"
+                eta_seconds = (self.total - current) / self._ema_speed if self.total > 0 and current > 0 else 0
+                self._eta_str = self._format_duration(eta_seconds) if eta_seconds > 0 else "--:--"
+                self._fmt_time = self._last_time
+            current_speed_str, eta = self._speed_str, self._eta_str
+        else:
+            # No speed sample yet: ETA from the overall average rate, speed from yt-dlp if provided
+            elapsed = now - self.start_time
+            eta_seconds = 0
+            if current > 0 and elapsed > 0 and self.total > 0:
+                eta_seconds = (self.total - current) / (current / elapsed)
+            eta = self._format_duration(eta_seconds) if eta_seconds > 0 else "--:--"
+            current_speed_str = extra_info
 
-        return (f"\r{Colors.PRIMARY}▶{Colors.RESET} {self.description[:30]:<30} "
-                f"[{bar}] {percentage:5.1f}% "
-                f"({current_size}/{total_size}){current_speed_str} "
-                f"ETA: {eta} ") # Removed extra_info from here as it's part of current_speed_str
+        # extra_info is not shown separately; it is part of current_speed_str
+        return _BAR_TMPL % (self._desc30, bar, percentage, current_size, self._total_fmt, current_speed_str, eta)
 
     @staticmethod
     def _format_bytes(bytes_val: float) -> str:
         """Format bytes with appropriate units"""
         if bytes_val < 0: bytes_val = 0.0
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_val < 1024:
-                return f"{bytes_val:.1f}{unit}"
-            bytes_val /= 1024
-        return f"{bytes_val:.1f}PB"
+        n = int(bytes_val)
+        # Unit index straight from the bit length (each unit is 2**10 of the previous)
+        unit_idx = 0 if n < 1024 else min(len(_UNITS) - 1, (n.bit_length() - 1) // 10)
+        return f"{bytes_val / (1 << (10 * unit_idx)):.1f}{_UNITS[unit_idx]}"
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
@@ -230,8 +307,9 @@ class ModernUI:
     """Advanced terminal UI with modern design elements"""
 
     @staticmethod
-    def print_banner():
-        """Display enhanced banner with version info"""
+    @functools.lru_cache(maxsize=1)
+    def _render_banner() -> str:
+        """Render the banner once; it never changes during a run"""
         banner_text = """
 ╭─────────────────────────────────────────────╮
 │  ██╗   ██╗████████╗██████╗  ██████╗ ██████╗ │
@@ -242,35 +320,46 @@ class ModernUI:
 │     ╚═╝      ╚═╝   ╚═════╝  ╚═════╝ ╚═╝  ╚═╝│
 ╰─────────────────────────────────────────────╯"""
 
-        print(Colors.gradient_text(banner_text, (64, 224, 255), (255, 100, 255)))
-        print(f"\n{Colors.PRIMARY}{Colors.BOLD}YtDorn v0.1.2{Colors.RESET} {Colors.MUTED}by 0xb0rn3{Colors.RESET}")
-        print(f"{Colors.INFO}Super Powerful YouTube Downloader{Colors.RESET}")
-        print(f"{Colors.MUTED}https://github.com/0xb0rn3/YtDorn {Colors.RESET}") # Example URL
-        print(Colors.gradient_text('═' * 50, (64, 224, 255), (255, 100, 255)))
+        return "\n".join((
+            Colors.gradient_text(banner_text, (64, 224, 255), (255, 100, 255)),
+            f"\n{Colors.PRIMARY}{Colors.BOLD}YtDorn v0.1.2{Colors.RESET} {Colors.MUTED}by 0xb0rn3{Colors.RESET}",
+            f"{Colors.INFO}Super Powerful YouTube Downloader{Colors.RESET}",
+            f"{Colors.MUTED}https://github.com/0xb0rn3/YtDorn {Colors.RESET}", # Example URL
+            Colors.gradient_text('═' * 50, (64, 224, 255), (255, 100, 255)),
+        )) + "\n"
 
     @staticmethod
-    def create_interactive_menu(title: str, options: List[Tuple[str, str, str]],
-                                show_shortcuts: bool = True) -> str:
-        """Create modern interactive menu with shortcuts and descriptions"""
-        print(f"\n{Colors.PRIMARY}{Colors.BOLD}┌─ {title} ─┐{Colors.RESET}")
+    def print_banner():
+        """Display enhanced banner with version info"""
+        sys.stdout.write(ModernUI._render_banner())
 
+    @staticmethod
+    def create_interactive_menu(title: str, options: Sequence[Tuple[str, str, str]],
+                                show_shortcuts: bool = True) -> int:
+        """Create modern interactive menu with shortcuts and descriptions; returns the 1-based choice"""
+        info, muted, reset = Colors.INFO, Colors.MUTED, Colors.RESET
+        lines = [f"\n{Colors.PRIMARY}{Colors.BOLD}┌─ {title} ─┐{reset}"]
         for i, (key, title_text, description) in enumerate(options, 1):
             icon = key if len(key) == 1 else str(i)
             shortcut = f"[{icon}]" if show_shortcuts else f"[{i}]"
-            print(f"{Colors.INFO}{shortcut:<4}{Colors.RESET} {title_text}")
+            lines.append(f"{info}{shortcut:<4}{reset} {title_text}")
             if description:
-                print(f"      {Colors.MUTED}{description}{Colors.RESET}")
-
-        print(f"{Colors.PRIMARY}└{'─' * (len(title) + 4)}┘{Colors.RESET}")
-
+                lines.append(f"      {muted}{description}{reset}")
+        lines.append(f"{Colors.PRIMARY}└{'─' * (len(title) + 4)}┘{reset}")
+        print("\n".join(lines)) # One write for the whole menu instead of one per line
+
+        # Accepted answers (key or number) -> numeric index, built once; the first option claiming
+        # an answer wins, same as checking the options in order
+        choices: Dict[str, int] = {}
+        for i, (key, _, _) in enumerate(options, 1):
+            choices.setdefault(key.lower(), i)
+            choices.setdefault(str(i), i)
+
+        prompt = f"\n{Colors.PRIMARY}❯{Colors.RESET} Select option: "
         while True:
-            prompt = f"\n{Colors.PRIMARY}❯{Colors.RESET} Select option: "
-            choice = input(prompt).strip().lower()
-
-            # Check for direct key match or number
-            for i, (key, _, _) in enumerate(options, 1):
-                if choice == key.lower() or choice == str(i):
-                    return str(i) # Return the numeric index as string
+            selected = choices.get(input(prompt).strip().lower())
+            if selected is not None:
+                return selected
 
             print(f"{Colors.ERROR}Invalid selection. Please try again.{Colors.RESET}")
 
@@ -303,30 +392,68 @@ class ModernUI:
         title_bar_length = max(max_key_length + 20, len(title) + 4)
 
 
-        print(f"\n{Colors.INFO}┌─ {title} {'─' * (title_bar_length - len(title) - 3)}┐")
-        for key, value in items.items():
-            print(f"{Colors.INFO}│{Colors.RESET} {key:<{max_key_length}} : {Colors.PRIMARY}{value}{Colors.RESET}")
-        print(f"{Colors.INFO}└{'─' * title_bar_length}┘{Colors.RESET}")
+        info, primary, reset = Colors.INFO, Colors.PRIMARY, Colors.RESET
+        lines = [f"\n{info}┌─ {title} {'─' * (title_bar_length - len(title) - 3)}┐"]
+        lines.extend(f"{info}│{reset} {key:<{max_key_length}} : {primary}{value}{reset}" for key, value in items.items())
+        lines.append(f"{info}└{'─' * title_bar_length}┘{reset}")
+        print("\n".join(lines))
+
+
+def _choose(ui: ModernUI, title: str, options: Sequence[Tuple[str, str, str]],
+            show_shortcuts: bool = True) -> str:
+    """Show a menu and return the key of the selected option"""
+    # create_interactive_menu only returns indexes of listed options
+    return options[ui.create_interactive_menu(title, options, show_shortcuts) - 1][0]
 
 
 class DependencyManager:
     """Advanced dependency management with better error handling"""
 
+    # Executable names looked for on PATH, per dependency
+    EXECUTABLES = {
+        'yt-dlp': ('yt-dlp', 'yt-dlp.exe'),
+        'ffmpeg': ('ffmpeg', 'ffmpeg.exe'),
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _scan_path() -> frozenset:
+        """Walk PATH once and return which of the wanted executable names exist"""
+        wanted = {name for names in DependencyManager.EXECUTABLES.values() for name in names}
+        found = set()
+        for directory in os.environ.get('PATH', '').split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name in wanted and entry.name not in found and os.access(entry.path, os.X_OK):
+                            found.add(entry.name)
+            except OSError:
+                continue # Missing or unreadable PATH entry
+        return frozenset(found)
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def check_system_dependencies() -> Dict[str, bool]:
-        """Comprehensive dependency check"""
-        deps = {}
-        deps['yt-dlp'] = shutil.which('yt-dlp') is not None
+        """Comprehensive dependency check (cached; see invalidate_cache)"""
+        on_path = DependencyManager._scan_path()
+        deps = {dep: not on_path.isdisjoint(names) for dep, names in DependencyManager.EXECUTABLES.items()}
         if not deps['yt-dlp']:
+            # Locate the module without importing it; the import is deferred until yt-dlp is first used
             try:
-                import yt_dlp
-                deps['yt-dlp'] = True
-            except ImportError:
+                deps['yt-dlp'] = importlib.util.find_spec('yt_dlp') is not None
+            except (ImportError, ValueError):
                 deps['yt-dlp'] = False # Explicitly set to False if both fail
-
-        deps['ffmpeg'] = shutil.which('ffmpeg') is not None
         return deps
 
+    @staticmethod
+    def invalidate_cache():
+        """Forget cached dependency results, e.g. after installing something"""
+        DependencyManager._scan_path.cache_clear()
+        DependencyManager.check_system_dependencies.cache_clear()
+        importlib.invalidate_caches() # So a freshly pip-installed yt_dlp can be imported
+
     @staticmethod
     def get_installation_instructions(missing_deps: List[str]) -> Dict[str, str]:
         """Provide installation instructions for missing dependencies"""
@@ -352,8 +479,7 @@ class DependencyManager:
     def install_missing_dependencies(spinner: ModernSpinner) -> bool:
         """Install missing dependencies with progress feedback"""
         spinner.start("Checking system dependencies...")
-        deps_status = DependencyManager.check_system_dependencies()
-        time.sleep(0.5) # Simulate check time
+        deps_status = dict(DependencyManager.check_system_dependencies()) # Copy; updated below
         
         missing_deps = [dep for dep, found in deps_status.items() if not found]
 
@@ -370,6 +496,7 @@ class DependencyManager:
                 print(f"{Colors.PRIMARY}{dep}:{Colors.RESET}\n{Colors.MUTED}{instruction}{Colors.RESET}")
 
         if 'yt-dlp' in missing_deps:
+            import subprocess # Only needed for this rare pip run; slow to import on every start
             print(f"{Colors.WARNING}Yt-dlp is essential. Attempting to install...{Colors.RESET}")
             spinner.start("Installing yt-dlp via pip...")
             try:
@@ -378,8 +505,9 @@ class DependencyManager:
                     # Consider adding --break-system-packages if appropriate for the target environment
                     # but it's generally better if the user manages their Python environment.
                 ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) # Use PIPE for stderr to check output
+                DependencyManager.invalidate_cache() # PATH and importable modules have changed
                 # Verify after install attempt
-                if shutil.which('yt-dlp') or hasattr(__import__('yt_dlp'), '__version__'):
+                if DependencyManager.check_system_dependencies()['yt-dlp']:
                     spinner.stop(f"{Colors.SUCCESS}✓ yt-dlp installed successfully.{Colors.RESET}")
                     deps_status['yt-dlp'] = True
                 else:
@@ -402,13 +530,152 @@ class DependencyManager:
         return deps_status.get('yt-dlp', False)
 
 
+def _output_dir_acceptable(path: str) -> bool:
+    """Validator for the output directory prompt: a new absolute dir needs an existing parent"""
+    # Cheap lexical check first; only absolute paths that don't exist yet cost extra stat() calls
+    if not os.path.isabs(path) or os.path.exists(path):
+        return True
+    if os.path.exists(os.path.dirname(os.path.normpath(path))):
+        return True
+    print(f"{Colors.ERROR}Parent directory does not exist: {os.path.dirname(os.path.normpath(path))}{Colors.RESET}")
+    return False
+
+# One playlist item selector as yt-dlp parses it: N, START-END or START:END:STEP (signed, 'inf' end)
+_PLAYLIST_ITEM_RE = re.compile(r'(?:[+-]?\d+)?(?:[:-](?:[+-]?\d+|inf(?:inite)?)?(?::[+-]?\d+)?)?') # yt-dlp's PLAYLIST_ITEMS_RE
+
+def _normalize_playlist_items(spec: Any) -> Optional[str]:
+    """Canonicalize a playlist item spec ('1, 3-5,1' -> '1,3-5'); None means every item
+
+    yt-dlp rejects spaces and empty selectors, so they are cleaned up once here
+    instead of failing for each URL. Raises ValueError for an invalid selector.
+    """
+    if spec is None:
+        return None
+    spec = str(spec).strip()
+    if spec.lower() in ('', 'all'):
+        return None
+    selectors: Dict[str, None] = {} # Insertion-ordered set: repeats are dropped, order kept
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if not _PLAYLIST_ITEM_RE.fullmatch(part):
+            raise ValueError(f"'{part}' is not a valid playlist item selector")
+        selectors[part] = None
+    return ','.join(selectors) or None
+
+def _playlist_items_acceptable(spec: str) -> bool:
+    """Validator for the playlist items prompt"""
+    try:
+        _normalize_playlist_items(spec)
+    except ValueError as e:
+        print(f"{Colors.ERROR}{e}{Colors.RESET}")
+        return False
+    return True
+
+# Format menu entries: (key, label, description)
+_FORMAT_OPTIONS: Tuple[Tuple[str, str, str], ...] = (
+    ('best', '🎬 Best Overall', 'Highest available video & audio (MP4 preferred)'),
+    ('bestvideo', '🏆 Best Video Only', 'Highest quality video stream (no audio)'),
+    ('bestaudio', '🎧 Best Audio Only', 'Highest quality audio stream'),
+    ('mp4_1080p', '📺 1080p HD (MP4)', 'Full HD quality (H.264, AAC)'),
+    ('mp4_720p', '📹 720p HD (MP4)', 'HD quality (H.264, AAC)'),
+    ('mp3', '🎶 MP3 Audio', 'Extract audio and convert to MP3 (192kbps)'),
+    ('m4a', '🎵 M4A Audio (AAC)', 'Extract audio in M4A format (best quality AAC)'),
+    ('custom', '⚙ Custom yt-dlp format', 'Specify custom format string'),
+)
+
+# yt-dlp format string for each format menu key ('custom' is asked for separately)
+_FORMAT_STRINGS: Dict[str, str] = {
+    'best': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best', # Prioritize MP4 container
+    'bestvideo': 'bestvideo',
+    'bestaudio': 'bestaudio/best',
+    'mp4_1080p': 'bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080][ext=mp4]',
+    'mp4_720p': 'bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]',
+    'mp3': 'bestaudio/best', # Actual conversion handled by postprocessor
+    'm4a': 'bestaudio[ext=m4a]/bestaudio', # Prefer m4a directly
+}
+
+# Format menu keys that imply audio extraction
+_AUDIO_FORMAT_KEYS = frozenset({'mp3', 'm4a', 'bestaudio'})
+
+# Pre-formatted options menu messages (colour codes are constants)
+_MSG_PLAYLIST_NOTICE = (f"{Colors.INFO}ℹ️ This is a playlist/channel with {{}} videos. "
+                        f"Options will apply to all items.{Colors.RESET}")
+_MSG_SAVED_INTO = f"{Colors.MUTED}Files will be saved into: {{}}{Colors.RESET}"
+
+# Status message templates for CLI output, filled with % at print time
+_ERR_FMT = f"{Colors.ERROR}%s{Colors.RESET}"
+_WARN_FMT = f"{Colors.WARNING}%s{Colors.RESET}"
+_OK_FMT = f"{Colors.SUCCESS}%s{Colors.RESET}"
+_INFO_FMT = f"{Colors.INFO}%s{Colors.RESET}"
+_MUTED_FMT = f"{Colors.MUTED}%s{Colors.RESET}"
+
+# Options that make yt-dlp write files for the playlist itself (info json, description,
+# thumbnail); those are only written when yt-dlp processes the whole playlist
+_PLAYLIST_FILE_OPTIONS = ('metadata_json', 'description_file', 'thumbnail')
+
+
 class SuperDownloader:
     """Advanced downloader with comprehensive YouTube support"""
 
+    DRAW_INTERVAL = 0.1 # Seconds between progress bar redraws (10 Hz)
+    LIVE_BAR_TIMEOUT = 1.0 # Seconds without updates after which another download takes the progress line
+
+    # Session cache of processed media info keyed by URL, least recently used first.
+    # Entries expire because the signed stream URLs inside them do (typically after a few hours).
+    INFO_CACHE_SIZE = 512
+    INFO_CACHE_TTL = 1800 # Seconds
+    _info_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+    _info_cache_lock = threading.Lock()
+
+    # Idle YoutubeDL instances for info extraction, reused so HTTP connections stay alive.
+    # A YoutubeDL is not thread-safe, so each caller takes one out of the pool while it works.
+    INFO_YDL_OPTS: Dict[str, Any] = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': 'in_playlist', # Extract flat for playlists, full for single videos
+        'skip_download': True, # Ensure no download happens here
+    }
+    _info_ydl_pool: List[Any] = []
+    _info_ydl_lock = threading.Lock()
+
     def __init__(self):
         self.progress_bars: Dict[str, AdvancedProgressBar] = {}
         self.download_stats: Dict[str, Dict[str, Any]] = {}
-        # self.concurrent_downloads = 3 # Not directly used by yt-dlp in this script structure
+        self._last_draw_times: Dict[str, float] = {} # Monotonic time of each bar's last redraw
+        self._live_bar: Optional[str] = None # Bar currently drawn on the progress line
+        self.concurrent_downloads = 3 # Worker threads used by download_many
+        # yt-dlp options shared by every download; per-call options are layered on top
+        self._base_opts: Dict[str, Any] = {
+            'no_warnings': True,
+            'progress_hooks': [self._progress_hook],
+            'quiet': True, # Suppress direct yt-dlp console output, rely on hooks
+            'noprogress': True, # Suppress yt-dlp's own progress bar, use ours
+        }
+        self._output_lock = threading.Lock() # Serializes hook state and terminal output across workers
+        self._cancel_event = threading.Event() # Set by cancel(); checked by the progress hook
+
+    def cancel(self):
+        """Ask running and pending downloads to stop at their next progress update"""
+        self._cancel_event.set()
+
+    def _start_batch(self):
+        """Reset cancellation at the start of a top-level download call
+
+        The downloader lives for the whole session, so a Ctrl+C that stopped one
+        download must not also cancel the next one the user starts.
+        """
+        self._cancel_event.clear()
+
+    def _progress_hook(self, d: Dict[str, Any]):
+        """Run download_hook under the output lock; downloads may run in worker threads"""
+        if self._cancel_event.is_set():
+            # yt-dlp stops cleanly on this and keeps the .part file so the next run can resume
+            from yt_dlp.utils import DownloadCancelled
+            raise DownloadCancelled('Download cancelled by user')
+        with self._output_lock:
+            self.download_hook(d)
 
     def download_hook(self, d: Dict[str, Any]):
         """Enhanced progress hook with detailed tracking"""
@@ -416,12 +683,11 @@ class SuperDownloader:
         if d['status'] == 'error':
             filename = d.get('filename', 'Unknown file')
             base_filename = os.path.basename(filename).replace('.temp', '') # Clean temp extension
-            sys.stdout.write('\r\033[K') # Clear line
-            print(f"{Colors.ERROR}✗ Error downloading {base_filename}: {d.get('error', 'Unknown error')}{Colors.RESET}")
-            if base_filename in self.progress_bars:
-                del self.progress_bars[base_filename]
-            if base_filename in self.download_stats:
-                del self.download_stats[base_filename]
+            # Clear the progress line and report in one write
+            _emit(f"\r{_CLEAR_LINE}{Colors.ERROR}✗ Error downloading {base_filename}: {d.get('error', 'Unknown error')}{Colors.RESET}\n")
+            self.progress_bars.pop(base_filename, None)
+            self.download_stats.pop(base_filename, None)
+            self._last_draw_times.pop(base_filename, None)
             return
 
 
@@ -447,85 +713,141 @@ class SuperDownloader:
                 self.download_stats[base_filename] = {'start_time': time.time(), 'total_bytes': int(total_bytes)}
 
             downloaded_bytes = d.get('downloaded_bytes', 0)
+            progress_bar = self.progress_bars[base_filename]
+
+            now = time.monotonic()
+            # With parallel downloads one bar owns the progress line until it finishes or goes
+            # quiet; the others keep counting and take over then instead of fighting over the line
+            owner = self._live_bar
+            if (owner is not None and owner != base_filename and owner in self.progress_bars
+                    and now - self._last_draw_times.get(owner, 0.0) < self.LIVE_BAR_TIMEOUT):
+                return
+            self._live_bar = base_filename
+
+            # yt-dlp can report many times per second; redraw at most every DRAW_INTERVAL
+            if (now - self._last_draw_times.get(base_filename, 0.0) < self.DRAW_INTERVAL
+                    and downloaded_bytes < progress_bar.total):
+                return
+            self._last_draw_times[base_filename] = now
+
             speed = d.get('speed', 0) # yt-dlp provides speed in bytes/sec
 
             extra_info_speed = ""
             if speed: # yt-dlp speed
                 extra_info_speed = f"{AdvancedProgressBar._format_bytes(speed)}" # No "/s" needed, handled by progress bar
 
-            progress_line = self.progress_bars[base_filename].update(int(downloaded_bytes), extra_info_speed)
-            sys.stdout.write(progress_line)
-            sys.stdout.flush()
+            progress_line = progress_bar.update(int(downloaded_bytes), extra_info_speed, now)
+            _emit(progress_line, droppable=True)
 
         elif d['status'] == 'finished':
-            if base_filename in self.progress_bars:
-                total_bytes = self.download_stats[base_filename]['total_bytes']
+            progress_bar = self.progress_bars.pop(base_filename, None)
+            if progress_bar is not None:
+                stats = self.download_stats.pop(base_filename)
                 # Ensure final update shows 100%
-                final_progress = self.progress_bars[base_filename].update(total_bytes, "")
-                sys.stdout.write(final_progress + "\n") # Move to next line after completion
-                sys.stdout.flush()
+                final_progress = progress_bar.update(stats['total_bytes'], "")
+                _emit(final_progress + "\n") # Move to next line after completion
 
-                duration = time.time() - self.download_stats[base_filename]['start_time']
+                duration = time.time() - stats['start_time']
                 # print(f"{Colors.SUCCESS}✓ {base_filename} completed in " # Replaced by bar's final print
                 #       f"{AdvancedProgressBar._format_duration(duration)}{Colors.RESET}")
-                del self.progress_bars[base_filename]
-                del self.download_stats[base_filename]
+                self._last_draw_times.pop(base_filename, None)
             else: # If no progress bar (e.g. very small file or already downloaded)
-                sys.stdout.write('\r\033[K') # Clear any partial line
-                print(f"{Colors.SUCCESS}✓ {base_filename} processed.{Colors.RESET}")
+                _emit(f"\r{_CLEAR_LINE}{Colors.SUCCESS}✓ {base_filename} processed.{Colors.RESET}\n") # Clear any partial line first
 
 
     def get_video_info(self, url: str) -> Dict[str, Any]:
         """Extract comprehensive video information"""
+        with self._info_cache_lock:
+            cached = self._info_cache.get(url)
+            if cached is not None:
+                stored_at, processed = cached
+                if time.monotonic() - stored_at < self.INFO_CACHE_TTL:
+                    self._info_cache.move_to_end(url)
+                    return processed
+                del self._info_cache[url] # Expired; extract again below
+
+        ydl = self._acquire_info_ydl()
+        try:
+            info = ydl.extract_info(url, download=False)
+            if not info: # Should not happen if no exception, but as safeguard
+                raise Exception("No information extracted.")
+            processed = self._process_video_info(info)
+        except Exception as e:
+            # More specific error from yt-dlp often in e.exc_info[1] or e.args
+            error_message = str(e)
+            if hasattr(e, 'exc_info') and e.exc_info and len(e.exc_info) > 1:
+                # Try to get a more specific yt-dlp error message
+                yt_dlp_error = str(e.exc_info[1])
+                if 'Unsupported URL' in yt_dlp_error or 'valid URL' in yt_dlp_error:
+                     error_message = f"Invalid or unsupported URL: {url}"
+                elif 'Unable to extract' in yt_dlp_error:
+                     error_message = f"Could not extract info from URL (may be private or unavailable): {yt_dlp_error}"
+                else:
+                     error_message = f"yt-dlp error: {yt_dlp_error}"
+
+            raise Exception(f"Could not extract video info: {error_message}")
+        finally:
+            self._release_info_ydl(ydl)
+
+        with self._info_cache_lock:
+            self._info_cache[url] = (time.monotonic(), processed)
+            self._info_cache.move_to_end(url)
+            if len(self._info_cache) > self.INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        return processed
+
+    @staticmethod
+    def _acquire_info_ydl():
+        """Take an idle info-extraction YoutubeDL from the pool, creating one if none is free"""
+        with SuperDownloader._info_ydl_lock:
+            if SuperDownloader._info_ydl_pool:
+                return SuperDownloader._info_ydl_pool.pop()
         from yt_dlp import YoutubeDL
+        return YoutubeDL(dict(SuperDownloader.INFO_YDL_OPTS))
 
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': 'in_playlist', # Extract flat for playlists, full for single videos
-            'skip_download': True, # Ensure no download happens here
-        }
+    @staticmethod
+    def _release_info_ydl(ydl):
+        """Return an info-extraction YoutubeDL to the pool for the next caller"""
+        with SuperDownloader._info_ydl_lock:
+            SuperDownloader._info_ydl_pool.append(ydl)
 
-        with YoutubeDL(ydl_opts) as ydl:
+    @staticmethod
+    def close_info_ydls():
+        """Close pooled info-extraction instances (registered with atexit)"""
+        with SuperDownloader._info_ydl_lock:
+            pool, SuperDownloader._info_ydl_pool = SuperDownloader._info_ydl_pool, []
+        for ydl in pool:
             try:
-                info = ydl.extract_info(url, download=False)
-                if not info: # Should not happen if no exception, but as safeguard
-                    raise Exception("No information extracted.")
-                return self._process_video_info(info)
-            except Exception as e:
-                # More specific error from yt-dlp often in e.exc_info[1] or e.args
-                error_message = str(e)
-                if hasattr(e, 'exc_info') and e.exc_info and len(e.exc_info) > 1:
-                    # Try to get a more specific yt-dlp error message
-                    yt_dlp_error = str(e.exc_info[1])
-                    if 'Unsupported URL' in yt_dlp_error or 'valid URL' in yt_dlp_error:
-                         error_message = f"Invalid or unsupported URL: {url}"
-                    elif 'Unable to extract' in yt_dlp_error:
-                         error_message = f"Could not extract info from URL (may be private or unavailable): {yt_dlp_error}"
-                    else:
-                         error_message = f"yt-dlp error: {yt_dlp_error}"
-
-                raise Exception(f"Could not extract video info: {error_message}")
+                ydl.close()
+            except Exception:
+                pass # Best effort during shutdown
 
+    def get_many_video_info(self, urls: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Fetch info for several URLs in parallel; results keep the order of `urls`"""
+        workers = max(1, min(max_workers or self.concurrent_downloads, len(urls)))
+        # Extraction is network bound, so threads overlap the per-URL latency
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_video_info, urls)) # Re-raises the first failure
 
     def _process_video_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
         """Process and clean video information"""
         processed = {}
-        is_playlist_or_channel = info.get('_type') == 'playlist' or info.get('_type') == 'multi_video' \
-                                 or 'entries' in info and info.get('entries') is not None
+        description = info.get('description') or '' # Looked up once for either branch
+        entries = info.get('entries') # Bound once; None for single videos
+        is_playlist_or_channel = entries is not None or info.get('_type') in ('playlist', 'multi_video')
 
 
         if is_playlist_or_channel:
             processed['is_playlist'] = True
             processed['playlist_title'] = info.get('title', 'Unknown Playlist/Channel')
-            processed['playlist_count'] = info.get('playlist_count') or len(info.get('entries', []))
+            processed['playlist_count'] = info.get('playlist_count') or len(entries or ())
             # For playlists, other details might be for the playlist itself, not a single video
             processed['title'] = processed['playlist_title'] # Use playlist title as main title
             processed['uploader'] = info.get('uploader', 'Various Artists') # Or channel name
-            processed['duration'] = sum(e.get('duration', 0) for e in info.get('entries', []) if e) if info.get('entries') else 0
+            processed['duration'] = sum(e.get('duration') or 0 for e in entries if e) if entries else 0 # Flat entries may lack a duration
             processed['view_count'] = info.get('view_count', 0) # Playlist views if available
             processed['upload_date'] = info.get('upload_date', '') # Playlist creation date if available
-            processed['description'] = info.get('description', '')[:200] + '...' if info.get('description') else ''
+            processed['description'] = f"{description[:200]}..." if description else ''
             processed['formats'] = 'N/A for playlists (per video)' # Formats are per video
             processed['is_live'] = False # Typically playlists aren't "live" in the same way
         else: # Single video
@@ -534,13 +856,11 @@ class SuperDownloader:
             processed['uploader'] = info.get('uploader', 'Unknown Uploader')
             processed['duration'] = info.get('duration', 0)
             processed['view_count'] = info.get('view_count', 0)
-            processed['upload_date'] = info.get('upload_date', '')
-            if processed['upload_date']:
-                try:
-                    processed['upload_date'] = datetime.strptime(processed['upload_date'], '%Y%m%d').strftime('%Y-%m-%d')
-                except ValueError:
-                    pass # Keep original if format is unexpected
-            processed['description'] = info.get('description', '')[:200] + '...' if info.get('description') else ''
+            upload_date = info.get('upload_date', '')
+            if upload_date and len(upload_date) == 8 and upload_date.isdigit(): # yt-dlp gives YYYYMMDD
+                upload_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:]}"
+            processed['upload_date'] = upload_date # Kept as is if the format is unexpected
+            processed['description'] = f"{description[:200]}..." if description else ''
             processed['formats'] = len(info.get('formats', [])) if info.get('formats') else 'Unknown'
             processed['is_live'] = info.get('is_live', False)
         
@@ -548,12 +868,10 @@ class SuperDownloader:
 
         return processed
 
-    def download_with_options(self, url: str, options: Dict[str, Any]):
-        """Download with comprehensive options"""
-        from yt_dlp import YoutubeDL
-
-        # Build yt-dlp options
+    def build_ydl_opts(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate YtDorn download options into yt-dlp parameters"""
         ydl_opts: Dict[str, Any] = {
+            **self._base_opts,
             'outtmpl': options.get('output_template', '%(title)s.%(ext)s'),
             'format': options.get('format', 'best'),
             'writesubtitles': options.get('subtitles', False),
@@ -563,16 +881,17 @@ class SuperDownloader:
             'writedescription': options.get('description_file', False), # Renamed for clarity
             'writeinfojson': options.get('metadata_json', False), # Renamed for clarity
             'ignoreerrors': options.get('ignore_errors', True), # True to continue playlist on error
-            'no_warnings': True,
-            'progress_hooks': [self.download_hook],
-            'quiet': True, # Suppress direct yt-dlp console output, rely on hooks
-            'noprogress': True, # Suppress yt-dlp's own progress bar, use ours
             'noplaylist': options.get('no_playlist', False), # If user explicitly wants to download only video from playlist URL
         }
         
         # Conditional options
         if options.get('playlist_items'):
-            ydl_opts['playlist_items'] = str(options['playlist_items'])
+            try:
+                playlist_items = _normalize_playlist_items(options['playlist_items'])
+            except ValueError:
+                playlist_items = str(options['playlist_items']) # Pass through; yt-dlp reports the error
+            if playlist_items:
+                ydl_opts['playlist_items'] = playlist_items
         if options.get('date_after'):
             ydl_opts['dateafter'] = options['date_after'] # YYYYMMDD
         if options.get('match_title'):
@@ -600,99 +919,232 @@ class SuperDownloader:
 
         if postprocessors:
             ydl_opts['postprocessors'] = postprocessors
+        return ydl_opts
+
+    def download_with_options(self, url: str, options: Dict[str, Any],
+                              info: Optional[Dict[str, Any]] = None,
+                              ydl_opts: Optional[Dict[str, Any]] = None):
+        """Download with comprehensive options
+
+        When `info` (a raw yt-dlp info dict for a single video) is given it is
+        downloaded directly, skipping a second extraction of `url`. `ydl_opts`
+        may carry parameters already built from `options` by build_ydl_opts.
+        """
+        self._start_batch()
+        return self._download(url, options, info, ydl_opts)
+
+    def _download(self, url: str, options: Dict[str, Any],
+                  info: Optional[Dict[str, Any]] = None,
+                  ydl_opts: Optional[Dict[str, Any]] = None,
+                  extra_info: Optional[Dict[str, Any]] = None) -> bool:
+        """Run one yt-dlp download as part of the current batch (see download_with_options)
+
+        `extra_info` is handed to yt-dlp for fields the info itself lacks, e.g. the
+        playlist fields of an entry downloaded on its own.
+        """
+        from yt_dlp import YoutubeDL
+        from yt_dlp.utils import DownloadCancelled
 
+        # YoutubeDL writes into its params dict, so a prebuilt one is copied per download
+        ydl_opts = dict(ydl_opts) if ydl_opts is not None else self.build_ydl_opts(options)
+
+        if self._cancel_event.is_set():
+            return False
         try:
             with YoutubeDL(ydl_opts) as ydl:
-                return_code = ydl.download([url])
+                if info is not None:
+                    # Same as yt-dlp's --load-info-json: sanitize_info returns a plain copy (lazy
+                    # lists expanded), so the cached original stays intact. The top level is copied
+                    # first because sanitize_info fills in a few defaults on the dict it is given.
+                    # Failures raise unless ignoreerrors is on, in which case they are reported
+                    # by yt-dlp and the batch carries on, as with download().
+                    ydl.process_ie_result(ydl.sanitize_info(dict(info)), download=True, extra_info=extra_info)
+                    return_code = 0
+                else:
+                    return_code = ydl.download([url])
                 if return_code != 0 and not options.get('ignore_errors', True):
                     # This path might not be hit often if ignoreerrors is True and hook handles errors
                     print(f"{Colors.ERROR}Download failed with yt-dlp error code: {return_code}{Colors.RESET}")
                     return False
             return True # Assume success if no exceptions raised and ignoreerrors is on
+        except DownloadCancelled:
+            print(f"\r{_CLEAR_LINE}{Colors.WARNING}🛑 Download cancelled. Partial files are kept for resuming.{Colors.RESET}")
+            return False
         except Exception as e:
             # This catches broader issues, hook handles per-file errors
             print(f"{Colors.ERROR}Download execution failed: {str(e)}{Colors.RESET}")
             return False
 
+    def download_many(self, urls: List[str], options: Dict[str, Any],
+                      max_workers: Optional[int] = None) -> int:
+        """Download several URLs with the same options in parallel; returns the success count"""
+        self._start_batch()
+        workers = max(1, min(max_workers or self.concurrent_downloads, len(urls)))
+        total = len(urls)
+        successful = 0
+        ydl_opts = self.build_ydl_opts(options) # Same for every URL, so built once
+
+        def run(index: int, url: str) -> bool:
+            if self._cancel_event.is_set():
+                return False # Cancelled before this item started
+            header = Colors.gradient_text(f'═ Item {index}/{total} ═', (64,224,255), (175,175,255))
+            with self._output_lock: # Header goes out in one write so it cannot split around a progress frame
+                _emit(f"\n{header}\n{Colors.PRIMARY}Processing URL: {url}{Colors.RESET}\n")
+            return self._download(url, options, ydl_opts=ydl_opts)
+
+        # Each worker runs its own YoutubeDL instance; network I/O releases the GIL
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, i, url): url for i, url in enumerate(urls, 1)}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        ok = future.result()
+                    except Exception as e: # download_with_options handles its own errors; this is a safety net
+                        ok = False
+                        with self._output_lock:
+                            print(f"{Colors.ERROR}Download execution failed: {str(e)}{Colors.RESET}")
+                    if ok:
+                        successful += 1 # Counts if the download call succeeded, not individual files in a playlist
+                    elif not self._cancel_event.is_set():
+                        with self._output_lock:
+                            print(f"{Colors.WARNING}⚠ Issues encountered with URL: {futures[future]}. Check logs.{Colors.RESET}")
+            except BaseException:
+                # Ctrl+C or exit while waiting: stop workers promptly so the executor shutdown does not block
+                self.cancel()
+                for future in futures:
+                    future.cancel()
+                raise
+        return successful
+
+    @staticmethod
+    def _is_video_entry(entry: Dict[str, Any]) -> bool:
+        """Whether a flat playlist entry is a single video rather than a nested playlist"""
+        entry_type = entry.get('_type', 'video')
+        if entry_type == 'video':
+            return True
+        # Flat entries point at the extractor that resolves them; channel tabs use YoutubeTab
+        return entry_type in ('url', 'url_transparent') and entry.get('ie_key') == 'Youtube'
+
+    def download_playlist(self, url: str, options: Dict[str, Any],
+                          max_workers: Optional[int] = None) -> bool:
+        """Download a playlist with its videos spread over several workers
+
+        The flat listing is extracted once (shared with get_video_info's cache) and
+        every video is downloaded on its own with the playlist fields yt-dlp would
+        add, so templates such as %(playlist_index)s come out as in one sequential
+        run. Item selections, playlist-level files and nested playlists (channel
+        tabs) are left to yt-dlp's own sequential handling.
+        """
+        self._start_batch()
+        workers = max(1, max_workers or self.concurrent_downloads)
+        if (workers == 1 or options.get('playlist_items') or options.get('no_playlist')
+                or any(options.get(key) for key in _PLAYLIST_FILE_OPTIONS)):
+            return self._download(url, options)
+
+        try:
+            playlist = self.get_video_info(url)['original_info']
+        except Exception:
+            return self._download(url, options) # yt-dlp reports the problem itself
+        entries = list(playlist.get('entries') or ())
+        if not entries or not all(entry is None or self._is_video_entry(entry) for entry in entries):
+            return self._download(url, options)
+
+        # Same fields yt-dlp adds to each entry of a playlist it processes itself
+        common_info = {
+            'playlist': playlist.get('title') or playlist.get('id'),
+            'playlist_id': playlist.get('id'),
+            'playlist_title': playlist.get('title'),
+            'playlist_uploader': playlist.get('uploader'),
+            'playlist_uploader_id': playlist.get('uploader_id'),
+            'playlist_channel': playlist.get('channel'),
+            'playlist_channel_id': playlist.get('channel_id'),
+            'playlist_webpage_url': playlist.get('webpage_url'),
+            'playlist_count': playlist.get('playlist_count') or len(entries),
+            'n_entries': len(entries),
+        }
+        jobs = [(index, entry) for index, entry in enumerate(entries, 1) if entry] # None: unavailable
+        total = len(jobs)
+        ydl_opts = self.build_ydl_opts(options) # Same for every entry, so built once
+        # yt-dlp zero-pads a plain %(playlist_index)s to the width of the last index when it
+        # walks the playlist itself; entries processed one by one need that width spelled out
+        width = len(str(len(entries)))
+        ydl_opts['outtmpl'] = ydl_opts['outtmpl'].replace('%(playlist_index)s', f'%(playlist_index)0{width}d')
+
+        def run(autonumber: int, index: int, entry: Dict[str, Any]) -> bool:
+            if self._cancel_event.is_set():
+                return False # Cancelled before this entry started
+            header = Colors.gradient_text(f'═ Item {autonumber}/{total} ═', (64,224,255), (175,175,255))
+            with self._output_lock:
+                _emit(f"\n{header}\n{Colors.PRIMARY}Processing: {entry.get('title') or entry.get('url')}{Colors.RESET}\n")
+            extra_info = dict(common_info, playlist_index=index, playlist_autonumber=autonumber)
+            return self._download(entry.get('url') or url, options, entry, ydl_opts, extra_info)
+
+        # Same shutdown handling as download_many; each worker has its own YoutubeDL instance
+        with ThreadPoolExecutor(max_workers=min(workers, total)) as executor:
+            futures = [executor.submit(run, autonumber, index, entry)
+                       for autonumber, (index, entry) in enumerate(jobs, 1)]
+            try:
+                return all([future.result() for future in futures])
+            except BaseException:
+                self.cancel()
+                for future in futures:
+                    future.cancel()
+                raise
+
     @staticmethod
-    def get_format_options() -> List[Tuple[str, str, str]]:
+    def get_format_options() -> Tuple[Tuple[str, str, str], ...]:
         """Get available format options with descriptions"""
-        return [
-            ('best', '🎬 Best Overall', 'Highest available video & audio (MP4 preferred)'),
-            ('bestvideo', '🏆 Best Video Only', 'Highest quality video stream (no audio)'),
-            ('bestaudio', '🎧 Best Audio Only', 'Highest quality audio stream'),
-            ('mp4_1080p', '📺 1080p HD (MP4)', 'Full HD quality (H.264, AAC)'),
-            ('mp4_720p', '📹 720p HD (MP4)', 'HD quality (H.264, AAC)'),
-            ('mp3', '🎶 MP3 Audio', 'Extract audio and convert to MP3 (192kbps)'),
-            ('m4a', '🎵 M4A Audio (AAC)', 'Extract audio in M4A format (best quality AAC)'),
-            ('custom', '⚙ Custom yt-dlp format', 'Specify custom format string'),
-        ]
+        return _FORMAT_OPTIONS
 
     @staticmethod
     def create_advanced_options_menu(ui: ModernUI, video_info: Dict[str, Any]) -> Dict[str, Any]:
         """Create comprehensive options selection menu."""
-        options: Dict[str, Any] = {}
+        # Final shape up front (defaults match download_with_options); branches below overwrite
+        options: Dict[str, Any] = {
+            'output_dir': None, 'output_template': None, 'format': 'best',
+            'extract_audio': False, 'audio_format': 'mp3', 'audio_quality': '192',
+            'subtitles': False, 'auto_subtitles': False, 'subtitle_langs': ['en'], 'embed_subs': False,
+            'thumbnail': False, 'embed_thumbnail': False,
+            'metadata_json': False, 'description_file': False,
+            'playlist_items': None, 'no_playlist': False,
+        }
         is_playlist = video_info.get('is_playlist', False)
         config = ConfigManager.load_config() # Load defaults
 
         if is_playlist:
             count = video_info.get('playlist_count', 'multiple')
-            print(f"{Colors.INFO}ℹ️ This is a playlist/channel with {count} videos. "
-                  f"Options will apply to all items.{Colors.RESET}")
+            print(_MSG_PLAYLIST_NOTICE.format(count))
             # Ask if user wants to download the playlist as a whole or select a single video from it (if applicable)
             # yt-dlp's default is to download all if a playlist URL is given without --no-playlist
             # options['no_playlist'] = False # Default to download all
 
         # --- Output Directory ---
         current_dir_display = os.getcwd()
-        default_output_val = config.get('default_output_dir', str(Path("downloads").resolve()))
+        recent_dirs = config.get('recent_output_dirs')
+        default_output_val = (recent_dirs[0] if recent_dirs else None) or config.get('default_output_dir') or _DEFAULT_CWD_DOWNLOADS
         
         user_path_input = ui.get_user_input(
             f"Output directory (current: {current_dir_display})",
             default=default_output_val,
-            validator=lambda x: Path(x).parent.exists() or Path(x).parent.is_dir() if not Path(x).exists() and Path(x).is_absolute() 
-                                else True # Basic check for parent existence for new dirs
+            validator=_output_dir_acceptable
         )
-        resolved_path = Path(user_path_input).resolve()
-        options['output_dir'] = str(resolved_path)
+        # abspath is purely lexical; symlinks don't need resolving for an output dir
+        options['output_dir'] = os.path.abspath(user_path_input)
         # Directory creation is handled in main() before download starts
-        print(f"{Colors.MUTED}Files will be saved into: {options['output_dir']}{Colors.RESET}")
+        print(_MSG_SAVED_INTO.format(options['output_dir']))
 
 
         # --- Format Selection ---
         format_menu_options = SuperDownloader.get_format_options()
-        format_choice_idx_str = ui.create_interactive_menu("Format Selection", format_menu_options)
-        # format_choice_key = format_menu_options[int(format_choice_idx_str) - 1][0]
-        
-        # Map choice index back to the key ('best', 'mp3', etc.)
-        # Ensure format_choice_idx_str is valid before indexing
-        try:
-            selected_format_option_idx = int(format_choice_idx_str) -1
-            if 0 <= selected_format_option_idx < len(format_menu_options):
-                 format_choice_key = format_menu_options[selected_format_option_idx][0]
-            else: # Should not happen with create_interactive_menu validation
-                format_choice_key = 'best' # Fallback
-        except ValueError:
-            format_choice_key = 'best' # Fallback
-
-
-        format_map = {
-            'best': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best', # Prioritize MP4 container
-            'bestvideo': 'bestvideo',
-            'bestaudio': 'bestaudio/best',
-            'mp4_1080p': 'bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080][ext=mp4]',
-            'mp4_720p': 'bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]',
-            'mp3': 'bestaudio/best', # Actual conversion handled by postprocessor
-            'm4a': 'bestaudio[ext=m4a]/bestaudio', # Prefer m4a directly
-        }
+        format_choice_key = _choose(ui, "Format Selection", format_menu_options) # 'best', 'mp3', etc.
 
         if format_choice_key == 'custom':
             options['format'] = ui.get_user_input("Enter custom yt-dlp format string", default="best")
         else:
-            options['format'] = format_map.get(format_choice_key, 'best')
+            options['format'] = _FORMAT_STRINGS.get(format_choice_key, 'best')
 
         # Audio specific options if an audio format was chosen
-        if format_choice_key in ['mp3', 'm4a', 'bestaudio']:
+        if format_choice_key in _AUDIO_FORMAT_KEYS:
             options['extract_audio'] = True
             if format_choice_key == 'mp3':
                 options['audio_format'] = 'mp3'
@@ -700,60 +1152,59 @@ class SuperDownloader:
             elif format_choice_key == 'm4a':
                 options['audio_format'] = 'm4a' # yt-dlp will pick best quality m4a by default for bestaudio[ext=m4a]
             # For 'bestaudio', audio_format can be other types like opus, vorbis. We don't force codec here.
-        else: # Video format or best overall
-            options['extract_audio'] = False
 
 
         # --- Additional Options ---
         # Subtitles
-        sub_choice = ui.create_interactive_menu("Subtitle Options", [
+        sub_choice = _choose(ui, "Subtitle Options", [
             ('y', 'Yes, download subtitles', 'If available, .srt or .vtt'),
             ('n', 'No subtitles', ''),
         ])
-        options['subtitles'] = (sub_choice == '1') # '1' corresponds to 'y'
+        options['subtitles'] = (sub_choice == 'y')
         if options['subtitles']:
-            options['auto_subtitles'] = ui.create_interactive_menu("Auto-generated Subtitles?", [
+            options['auto_subtitles'] = _choose(ui, "Auto-generated Subtitles?", [
                 ('y', 'Yes, include auto-generated if manual are missing', ''),
                 ('n', 'No, only manual subtitles', ''),
-            ]) == '1'
-            options['subtitle_langs'] = [ui.get_user_input("Subtitle language(s) (comma-separated, e.g., en,es)", default="en")]
-            options['embed_subs'] = ui.create_interactive_menu("Embed Subtitles?", [
+            ]) == 'y'
+            options['subtitle_langs'] = _split_csv(ui.get_user_input("Subtitle language(s) (comma-separated, e.g., en,es)", default="en"))
+            options['embed_subs'] = _choose(ui, "Embed Subtitles?", [
                  ('y', 'Yes, embed into video file (if supported)', 'Requires FFmpeg'),
                  ('n', 'No, save as separate file', ''),
-            ]) == '1'
+            ]) == 'y'
 
 
         # Thumbnail
-        thumb_choice = ui.create_interactive_menu("Thumbnail Options", [
+        thumb_choice = _choose(ui, "Thumbnail Options", [
             ('y', 'Yes, download thumbnail', 'Saves as .jpg or .webp'),
             ('n', 'No thumbnail', '')
         ])
-        options['thumbnail'] = (thumb_choice == '1')
-        if options['thumbnail'] and not options.get('extract_audio', False): # Embedding usually for video/audio files
-            options['embed_thumbnail'] = ui.create_interactive_menu("Embed Thumbnail?", [
+        options['thumbnail'] = (thumb_choice == 'y')
+        if options['thumbnail'] and not options['extract_audio']: # Embedding usually for video/audio files
+            options['embed_thumbnail'] = _choose(ui, "Embed Thumbnail?", [
                  ('y', 'Yes, embed into media file (if supported)', 'Requires FFmpeg'),
                  ('n', 'No, save as separate file', ''),
-            ]) == '1'
+            ]) == 'y'
 
 
         # Metadata and Description files
-        meta_choice = ui.create_interactive_menu("Extra Files Options", [
+        meta_choice = _choose(ui, "Extra Files Options", [
             ('j', 'JSON Info', 'Save full video metadata to a .json file'),
             ('d', 'Description File', 'Save video description to a .description file'),
             ('n', 'None', 'Skip these extra files')
         ])
-        if meta_choice == '1': options['metadata_json'] = True
-        if meta_choice == '2': options['description_file'] = True
-        # If 'n' (index '3'), defaults (False) are kept.
+        if meta_choice == 'j': options['metadata_json'] = True
+        if meta_choice == 'd': options['description_file'] = True
+        # If 'n', defaults (False) are kept.
 
         if is_playlist:
-            playlist_opts_choice = ui.create_interactive_menu("Playlist Specific Options", [
+            playlist_opts_choice = _choose(ui, "Playlist Specific Options", [
                 ('all', "Download all items", "Default behavior for playlists."),
                 ('items', "Specify item numbers/range", "e.g., 1,3,5-7"),
                 ('skip', "Skip playlist options", "Use defaults")
             ])
-            if playlist_opts_choice == '2': # 'items'
-                options['playlist_items'] = ui.get_user_input("Playlist items (e.g., 1-5,8,10)", default="all")
+            if playlist_opts_choice == 'items':
+                options['playlist_items'] = _normalize_playlist_items(ui.get_user_input(
+                    "Playlist items (e.g., 1-5,8,10)", default="all", validator=_playlist_items_acceptable))
             # 'all' or 'skip' implies default yt-dlp behavior (download all if not 'no_playlist')
 
         # --- Output Template ---
@@ -763,34 +1214,63 @@ class SuperDownloader:
         # yt-dlp default outtmpl is `%(title)s [%(id)s].%(ext)s`
         # We'll use a simpler one, but easily customizable if we expose this later.
         filename_pattern = "%(title).150s.%(ext)s"
-        if is_playlist and options.get('playlist_items', 'all') == 'all' and not options.get('no_playlist'):
+        if is_playlist and options['playlist_items'] in (None, 'all') and not options['no_playlist']:
              # Add playlist index if it's a playlist and we are downloading items from it
              filename_pattern = "%(playlist_index)s - %(title).150s.%(ext)s"
         
-        options['output_template'] = str(Path(options['output_dir']) / filename_pattern)
+        options['output_template'] = os.path.join(options['output_dir'], filename_pattern)
 
         return options
 
+    @staticmethod
+    def create_options_from_preset(preset_name: str) -> Dict[str, Any]:
+        """Build download options from a saved preset without any interactive prompts.
+
+        Only the preset's own values are returned; the caller resolves the output
+        directory and filename template once all option layers are merged.
+        """
+        return dict(ConfigManager.load_config().get('presets', {})[preset_name])
+
+atexit.register(SuperDownloader.close_info_ydls)
+
+_YT_HOST_TAILS = frozenset({'youtube.com', 'youtu.be'})
+# First youtube.com path segment -> query parameter it requires (None: the path alone is enough)
+_YT_PATH_RULES: Dict[str, Optional[str]] = {
+    'watch': 'v', 'playlist': 'list',
+    'channel': None, 'c': None, 'user': None, 'shorts': None, 'live': None,
+}
+# Canonical YouTube URLs accepted without a full urlparse/parse_qs round trip
+_YT_RE = re.compile(
+    r'https?://(?:'
+    r'(?:(?:www|m|music)\.)?youtube\.com/(?:'
+    r'(?:watch\?(?:[^#]*&)?v|playlist\?(?:[^#]*&)?list)=[^&#]'
+    r'|(?:channel|c|user|shorts|live)/)'
+    r'|youtu\.be/[^/?#])'
+)
+
 def validate_url(url: str) -> bool:
     """Basic validation for YouTube URLs or common video URLs"""
     if not url or not isinstance(url, str):
         return False
+    if _YT_RE.match(url): # Common case: one regex match, no parsing
+        return True
     try:
         parsed = urlparse(url)
         if not all([parsed.scheme, parsed.netloc]):
             print(f"{Colors.WARNING}URL seems malformed (missing scheme or domain).{Colors.RESET}")
             return False # Basic structural check
 
-        # Common YouTube domains
-        youtube_domains = ['youtube.com', 'youtu.be', 'm.youtube.com']
-        if any(domain in parsed.netloc.lower() for domain in youtube_domains):
+        # Common YouTube domains (www., m., music. etc. share the same registered domain)
+        host = parsed.hostname or ''
+        host_tail = '.'.join(host.rsplit('.', 2)[-2:])
+        if host_tail in _YT_HOST_TAILS:
             # More specific checks for YouTube (optional, yt-dlp is the ultimate validator)
-            if 'youtube.com' in parsed.netloc.lower():
-                query_params = parse_qs(parsed.query)
-                if parsed.path.startswith('/watch') and 'v' in query_params: return True
-                if parsed.path.startswith('/playlist') and 'list' in query_params: return True
-                if parsed.path.startswith(('/channel/', '/c/', '/user/')): return True
-            elif 'youtu.be' in parsed.netloc.lower() and parsed.path != '/': return True # youtu.be/VIDEOID
+            if host_tail == 'youtube.com':
+                segment = parsed.path.split('/', 2)[1] if parsed.path else ''
+                if segment in _YT_PATH_RULES:
+                    required_param = _YT_PATH_RULES[segment]
+                    if required_param is None or required_param in parse_qs(parsed.query): return True
+            elif parsed.path != '/': return True # youtu.be/VIDEOID
             # If it's a YouTube domain but doesn't match specific patterns, still let yt-dlp try
             print(f"{Colors.MUTED}URL is a YouTube domain, attempting anyway...{Colors.RESET}")
             return True
@@ -809,16 +1289,55 @@ def validate_url(url: str) -> bool:
         return False
 
 
+def _build_playlist_info(video_info: Dict[str, Any]) -> Dict[str, str]:
+    """Build the preview panel items for a playlist/channel"""
+    return {
+        'Title': video_info['title'],
+        'Type': 'Playlist/Channel',
+        'Item Count': str(video_info['playlist_count']),
+    }
+
+def _build_video_info(video_info: Dict[str, Any]) -> Dict[str, str]:
+    """Build the preview panel items for a single video"""
+    get = video_info.get
+    views = get('view_count')
+    return {
+        'Title': video_info['title'],
+        'Type': 'Single Video',
+        'Uploader': video_info['uploader'],
+        'Duration': AdvancedProgressBar._format_duration(get('duration') or 0),
+        'Views': f"{views:,}" if views else 'N/A',
+        'Uploaded': get('upload_date', 'N/A'),
+        'Formats (approx.)': str(get('formats', 'N/A')),
+        'Live?': 'Yes' if get('is_live') else 'No',
+    }
+
+
+# Lazily created, process-wide UI/spinner/downloader instances
+@functools.lru_cache(maxsize=1)
+def _ui() -> ModernUI:
+    return ModernUI()
+
+@functools.lru_cache(maxsize=1)
+def _spinner() -> ModernSpinner:
+    return ModernSpinner(style='dots')
+
+@functools.lru_cache(maxsize=1)
+def _downloader() -> 'SuperDownloader':
+    return SuperDownloader()
+
+
 def main():
     """Enhanced main function with comprehensive features"""
-    ui = ModernUI()
-    spinner = ModernSpinner(style='dots')
-    downloader = SuperDownloader() # Instance of SuperDownloader
+    ui = _ui()
+    spinner = _spinner()
+    downloader = _downloader()
 
     # Signal handler for graceful exit
     def signal_handler(signum, frame):
         print(f"\n\n{Colors.WARNING}🛑 Download interrupted by user (Ctrl+C). Exiting gracefully...{Colors.RESET}\n")
         spinner.stop() # Ensure spinner is stopped
+        downloader.cancel() # Let running downloads stop cleanly and keep their .part files
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
@@ -842,10 +1361,7 @@ def main():
                 ('i', '📊 Get Media Info', 'Fetch detailed information without downloading'),
                 ('q', '🚪 Quit', 'Exit the application'),
             ]
-            choice_idx_str = ui.create_interactive_menu("Main Menu", main_options)
-            
-            # Map choice index back to key
-            user_choice = main_options[int(choice_idx_str)-1][0]
+            user_choice = _choose(ui, "Main Menu", main_options)
 
 
             if user_choice == 'q':  # Quit
@@ -863,11 +1379,11 @@ def main():
                     # If it returns False without printing, means it's just a warning state.
                     # Ask user if they want to proceed with a potentially problematic URL.
                     if not any(err_kw in url_input.lower() for err_kw in ["invalid", "malformed"]): # Avoid re-prompt if truly bad
-                        proceed = ui.create_interactive_menu(f"URL Validation Warning", [
+                        proceed = _choose(ui, "URL Validation Warning", [
                             ('y', "Proceed with this URL anyway", url_input),
                             ('n', "Re-enter URL", "")
                         ])
-                        if proceed == '1': # Yes, proceed
+                        if proceed == 'y':
                             url = url_input
                         # Else, loop will continue to ask for URL
                     # If validate_url printed a hard error, it won't reach here or url remains ""
@@ -886,21 +1402,10 @@ def main():
                 continue
 
             # Display common info for both 'info' and 'download' paths
-            info_items = {
-                'Title': video_info['title'],
-                'Type': 'Playlist/Channel' if video_info['is_playlist'] else 'Single Video',
-            }
             if video_info['is_playlist']:
-                info_items['Item Count'] = str(video_info['playlist_count'])
-            else: # Single video
-                info_items['Uploader'] = video_info['uploader']
-                info_items['Duration'] = AdvancedProgressBar._format_duration(video_info['duration'])
-            
-            if not video_info['is_playlist']: # More details for single items
-                info_items['Views'] = f"{video_info.get('view_count', 0):,}" if video_info.get('view_count') else 'N/A'
-                info_items['Uploaded'] = video_info.get('upload_date', 'N/A')
-                info_items['Formats (approx.)'] = str(video_info.get('formats', 'N/A'))
-                info_items['Live?'] = 'Yes' if video_info.get('is_live', False) else 'No'
+                info_items = _build_playlist_info(video_info)
+            else:
+                info_items = _build_video_info(video_info)
 
             ui.show_info_panel("Media Preview", info_items)
 
@@ -922,8 +1427,7 @@ def main():
                 ('m', '⚙️ Modify Options', 'Change download settings'),
                 ('c', '❌ Cancel & Main Menu', 'Return to main menu'),
             ]
-            confirm_choice_idx_str = ui.create_interactive_menu("Confirm Download", confirm_options_list)
-            confirm_action = confirm_options_list[int(confirm_choice_idx_str)-1][0]
+            confirm_action = _choose(ui, "Confirm Download", confirm_options_list)
 
 
             if confirm_action == 'c':  # Cancel
@@ -938,17 +1442,23 @@ def main():
                 
                 # Ensure output directory exists (resolved path is in download_options['output_dir'])
                 try:
-                    output_dir_path = Path(download_options['output_dir'])
-                    output_dir_path.mkdir(parents=True, exist_ok=True)
+                    os.makedirs(download_options['output_dir'], exist_ok=True)
                 except OSError as e:
                     print(f"{Colors.ERROR}Error creating output directory {download_options['output_dir']}: {e}{Colors.RESET}")
                     continue # Or handle more gracefully
+                ConfigManager.add_recent_output_dir(download_options['output_dir'])
 
-                success = downloader.download_with_options(url, download_options)
+                if video_info['is_playlist']: # Entries are split across the configured number of workers
+                    success = downloader.download_playlist(url, download_options,
+                                                           ConfigManager.load_config().get('default_concurrency'))
+                else:
+                    # A single video was fully extracted for the preview; reuse it instead of fetching again
+                    reuse_info = video_info.get('original_info')
+                    success = downloader.download_with_options(url, download_options, reuse_info)
 
                 if success: # yt-dlp handles individual file successes/failures with ignoreerrors
                     print(f"\n{Colors.SUCCESS}✨ Download process completed!{Colors.RESET}")
-                    print(f"{Colors.INFO}📁 Files saved to (or attempted in): {os.path.abspath(download_options['output_dir'])}{Colors.RESET}")
+                    print(f"{Colors.INFO}📁 Files saved to (or attempted in): {download_options['output_dir']}{Colors.RESET}")
                 else:
                     # download_with_options or download_hook would have printed specific errors
                     print(f"\n{Colors.WARNING}⚠️ Download process finished with some issues. Check messages above.{Colors.RESET}")
@@ -959,11 +1469,11 @@ def main():
             spinner.stop()
             # No 'continue' here, KeyboardInterrupt usually means exit intent for the current operation
             # Ask if user wants to exit YtDorn or go to main menu
-            exit_choice = ui.create_interactive_menu("Interrupted", [
+            exit_choice = _choose(ui, "Interrupted", [
                 ('m', "Return to Main Menu", ""),
                 ('q', "Quit YtDorn", "")
             ], show_shortcuts=False)
-            if exit_choice == '2': # Quit
+            if exit_choice == 'q':
                 print(f"\n{Colors.SUCCESS}👋 Exiting YtDorn. Goodbye!{Colors.RESET}\n")
                 sys.exit(0)
             # Else, loop continues (back to main menu)
@@ -975,11 +1485,11 @@ def main():
             # import traceback
             # print(f"{Colors.MUTED}{traceback.format_exc()}{Colors.RESET}")
             # Ask to continue or quit
-            error_choice = ui.create_interactive_menu("Unexpected Error", [
+            error_choice = _choose(ui, "Unexpected Error", [
                 ('m', "Try returning to Main Menu", ""),
                 ('q', "Quit YtDorn", "")
             ], show_shortcuts=False)
-            if error_choice == '2': # Quit
+            if error_choice == 'q':
                 print(f"\n{Colors.SUCCESS}👋 Exiting YtDorn. Goodbye!{Colors.RESET}\n")
                 sys.exit(1) # Exit with error code
             # Else, loop continues (back to main menu)
@@ -996,60 +1506,65 @@ class BatchDownloader: # Retained, but not integrated into interactive main menu
     def download_from_file(file_path: str, base_options: Dict[str, Any], ui: ModernUI, downloader: SuperDownloader) -> bool:
         """Download multiple URLs from a text file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                urls = [line.strip() for line in f if line.strip() and not line.startswith('#')] # Ignore empty lines and comments
-
-            valid_urls = [url for url in urls if validate_url(url)]
-
-            if not valid_urls:
+            # Single pass over the file: only the unique valid URLs are kept in memory.
+            # Read as bytes so blank and comment lines are skipped without being decoded.
+            raw_count = 0
+            duplicate_count = 0
+            seen_urls: Dict[str, None] = {} # Insertion-ordered set of valid URLs
+            with open(file_path, 'rb') as f:
+                for line in f:
+                    raw_count += 1
+                    stripped = line.strip()
+                    if not stripped or stripped[:1] == b'#': # Ignore empty lines and comments
+                        continue
+                    try:
+                        url = stripped.decode('utf-8')
+                    except UnicodeDecodeError:
+                        print(f"{Colors.WARNING}Skipping line {raw_count}: not valid UTF-8.{Colors.RESET}")
+                        continue
+                    if url in seen_urls: # Repeats are fetched once and not re-validated
+                        duplicate_count += 1
+                    elif validate_url(url):
+                        seen_urls[url] = None
+
+            if not seen_urls:
                 print(f"{Colors.ERROR}No valid URLs found in file: {file_path}{Colors.RESET}")
                 return False
 
-            print(f"{Colors.INFO}Found {len(valid_urls)} valid URLs in {file_path} (out of {len(urls)} lines).{Colors.RESET}")
+            if duplicate_count:
+                print(f"{Colors.MUTED}Skipping {duplicate_count} duplicate URL(s).{Colors.RESET}")
+            valid_urls = list(seen_urls)
+
+            print(f"{Colors.INFO}Found {len(valid_urls)} valid URLs in {file_path} (out of {raw_count} lines).{Colors.RESET}")
             
             # Confirm batch download
-            confirm_batch = ui.create_interactive_menu(f"Batch Download ({len(valid_urls)} URLs)", [
+            confirm_batch = _choose(ui, f"Batch Download ({len(valid_urls)} URLs)", [
                 ('s', "Start Batch Download", "Use provided options for all URLs"),
                 ('c', "Cancel Batch", "")
             ])
-            if confirm_batch != '1':
+            if confirm_batch != 's':
                 print(f"{Colors.WARNING}Batch download cancelled.{Colors.RESET}")
                 return False
 
-            successful_downloads = 0
             total_urls = len(valid_urls)
 
-            for i, url in enumerate(valid_urls, 1):
-                print(f"\n{Colors.gradient_text(f'═ Batch Item {i}/{total_urls} ═', (64,224,255), (175,175,255))}")
-                print(f"{Colors.PRIMARY}Processing URL: {url}{Colors.RESET}")
-                
-                # Fetch info for this specific URL to customize options if needed, or just use base_options
-                # For simplicity, we'll use the base_options provided via CLI for all batch items.
-                # A more advanced batch mode might re-prompt or use per-URL configs.
-                current_options = base_options.copy() # Start with base CLI options
-
-                # Ensure output directory exists for this item, potentially using a subfolder structure
-                # Example: base_output_dir / playlist_title_or_url_hash / video_title.ext
-                # For now, all batch items go to the same specified output dir.
-                output_dir_path = Path(current_options['output_dir'])
-                try:
-                    output_dir_path.mkdir(parents=True, exist_ok=True)
-                except OSError as e:
-                    print(f"{Colors.ERROR}Error creating output directory {output_dir_path} for {url}: {e}{Colors.RESET}")
-                    print(f"{Colors.WARNING}⚠ Skipping URL due to directory error: {url}{Colors.RESET}")
-                    continue
-                
-                # Update output template to ensure it's in the resolved directory
-                filename_pattern = "%(title).150s.%(ext)s" # Default pattern for batch items
-                # Potentially add %(playlist_index)s if URL is a playlist, but yt-dlp handles this if URL itself is a playlist.
-                current_options['output_template'] = str(output_dir_path / filename_pattern)
+            # All batch items go to the same specified output dir
+            # (a more advanced batch mode might use per-URL subfolders or options)
+            current_options = base_options.copy() # Start with base CLI options
+            try:
+                os.makedirs(current_options['output_dir'], exist_ok=True)
+            except OSError as e:
+                print(f"{Colors.ERROR}Error creating output directory {current_options['output_dir']}: {e}{Colors.RESET}")
+                return False
 
+            # Default pattern for batch items; yt-dlp adds playlist context itself for playlist URLs
+            filename_pattern = "%(title).150s.%(ext)s"
+            current_options['output_template'] = os.path.join(current_options['output_dir'], filename_pattern)
+
+            # Items download in parallel; the downloader serializes their terminal output
+            successful_downloads = downloader.download_many(valid_urls, current_options,
+                                                            current_options.get('concurrency'))
 
-                if downloader.download_with_options(url, current_options):
-                    successful_downloads += 1 # Counts if the download call succeeded, not individual files in a playlist
-                else:
-                    print(f"{Colors.WARNING}⚠ Issues encountered with URL: {url}. Check logs.{Colors.RESET}")
-            
             print(f"\n{Colors.gradient_text('═ Batch Complete ═', (0,255,127), (64,224,255))}")
             if successful_downloads == total_urls:
                  print(f"{Colors.SUCCESS}✅ Batch download fully completed: {successful_downloads}/{total_urls} URLs processed successfully.{Colors.RESET}")
@@ -1065,39 +1580,111 @@ class BatchDownloader: # Retained, but not integrated into interactive main menu
             # import traceback; print(traceback.format_exc()) # For debugging
             return False
 
+# Default locations, computed once at import
+_DEFAULT_DOWNLOADS_DIR = str(Path.home() / "Downloads" / "YtDorn")
+_DEFAULT_CWD_DOWNLOADS = os.path.abspath("downloads")
+
 class ConfigManager:
     """Manage user configurations and presets"""
 
     CONFIG_FILE = str(Path.home() / ".ytdorn_config.json")
+    MAX_RECENT_DIRS = 5
+    SCHEMA_VERSION = 1 # Bump when top-level keys are added to the default config
+    # Config loaded by this process; save_config keeps it current
+    _loaded: Optional[Dict[str, Any]] = None
+    _pending_recent_dirs: List[str] = [] # Output dirs used since the last save, oldest first
 
     @staticmethod
     def load_config() -> Dict[str, Any]:
-        """Load user configuration"""
+        """Load user configuration (read from disk once per process)"""
+        if ConfigManager._loaded is None:
+            ConfigManager._loaded = ConfigManager._read_config_file()
+        return ConfigManager._loaded
+
+    @staticmethod
+    def add_recent_output_dir(path: str):
+        """Move `path` to the front of the recent output directories (saved at exit)"""
+        config = ConfigManager.load_config()
+        recent_dirs = config.get('recent_output_dirs') or []
+        if recent_dirs[:1] == [path]:
+            return # Already the most recent; nothing to write
+        config['recent_output_dirs'] = ConfigManager._move_to_front(recent_dirs, path)
+        ConfigManager._pending_recent_dirs.append(path)
+
+    @staticmethod
+    def _move_to_front(recent_dirs: List[str], path: str) -> List[str]:
+        """Return `recent_dirs` with `path` first, without duplicates, capped at MAX_RECENT_DIRS"""
+        # Insertion-ordered set, oldest first: dedup and move-to-front are two dict operations
+        ordered = dict.fromkeys(reversed(recent_dirs))
+        ordered.pop(path, None)
+        ordered[path] = None
+        return list(reversed(ordered))[:ConfigManager.MAX_RECENT_DIRS]
+
+    @staticmethod
+    def flush():
+        """Save the output dirs used in this session into the config file on disk"""
+        pending = ConfigManager._pending_recent_dirs
+        if not pending:
+            return
+        # Merge into the current file instead of writing the snapshot loaded at startup, so
+        # changes made meanwhile by another ytdorn (e.g. --config) are kept
+        config = ConfigManager._read_config_file()
+        recent_dirs = config.get('recent_output_dirs') or []
+        for path in pending:
+            recent_dirs = ConfigManager._move_to_front(recent_dirs, path)
+        config['recent_output_dirs'] = recent_dirs
+        ConfigManager.save_config(config) # Clears the pending list on success
+
+    @staticmethod
+    def _read_config_file() -> Dict[str, Any]:
+        """Read the config from disk"""
         try:
-            if Path(ConfigManager.CONFIG_FILE).exists():
-                with open(ConfigManager.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            with open(ConfigManager.CONFIG_FILE, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson else json.loads(data)
         except Exception as e:
             # print(f"{Colors.WARNING}Could not load config file: {e}{Colors.RESET}")
-            pass # Silently ignore load errors, use defaults
-        return ConfigManager._get_default_config()
+            return ConfigManager._get_default_config() # Silently ignore load errors, use defaults
+        if not isinstance(config, dict):
+            return ConfigManager._get_default_config()
+
+        # Current files skip building the defaults; older ones get the missing keys in memory
+        # (written back only with the next real change, so read-only runs never touch the file)
+        if config.get('_schema_version') != ConfigManager.SCHEMA_VERSION:
+            for key, value in ConfigManager._get_default_config().items():
+                config.setdefault(key, value)
+            config['_schema_version'] = ConfigManager.SCHEMA_VERSION
+        return config
 
     @staticmethod
     def save_config(config: Dict[str, Any]) -> bool:
         """Save user configuration"""
+        # Write to a temp file and swap it in so readers never see a torn file
+        tmp_file = ConfigManager.CONFIG_FILE + '.tmp'
         try:
-            with open(ConfigManager.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-            return True
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2) if orjson else json.dumps(config, indent=2).encode('utf-8')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno()) # Data must be on disk before the rename makes it the config
+            os.replace(tmp_file, ConfigManager.CONFIG_FILE)
         except Exception as e:
             print(f"{Colors.ERROR}Could not save config file: {e}{Colors.RESET}")
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
             return False
+        ConfigManager._loaded = config # Later loads in this process see what was written
+        ConfigManager._pending_recent_dirs.clear() # Written with this config
+        return True
 
     @staticmethod
     def _get_default_config() -> Dict[str, Any]:
         """Get default configuration"""
         return {
-            'default_output_dir': str(Path.home() / "Downloads" / "YtDorn"),
+            '_schema_version': ConfigManager.SCHEMA_VERSION,
+            'default_output_dir': _DEFAULT_DOWNLOADS_DIR,
             'default_format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
             'default_audio_format': 'mp3', # For audio extraction
             'default_audio_quality': '192',
@@ -1106,6 +1693,8 @@ class ConfigManager:
             'default_subtitle_langs': ['en'],
             'default_thumbnail': False,
             'ignore_errors': True, # For playlists primarily
+            'default_concurrency': 3, # Parallel downloads in batch mode
+            'recent_output_dirs': [], # Most recent first, see add_recent_output_dir
             'presets': {
                 'default_video': {
                     'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
@@ -1154,6 +1743,54 @@ class ConfigManager:
             }
         }
 
+atexit.register(ConfigManager.flush) # No-op unless output dirs were used this session
+
+# Audio codecs accepted by yt-dlp's FFmpegExtractAudio postprocessor
+_AUDIO_CODECS = ('best', 'aac', 'alac', 'flac', 'm4a', 'mp3', 'opus', 'vorbis', 'wav')
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated argument into a list of stripped items"""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def _playlist_items_arg(value: str) -> Optional[str]:
+    """argparse type for --playlist-items"""
+    try:
+        return _normalize_playlist_items(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def _parse_config_item(item: str) -> Tuple[str, Any]:
+    """argparse type for --config: split key=value and coerce known top-level keys"""
+    key, sep, value = item.partition('=')
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"invalid config item '{item}', use key=value")
+    default = ConfigManager._get_default_config().get(key)
+    # bool before int: bool is a subclass of int
+    if isinstance(default, bool):
+        return key, value.lower() in ('true', '1', 'yes')
+    if isinstance(default, int):
+        try:
+            return key, int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"'{key}' expects an integer, got '{value}'")
+    if isinstance(default, list):
+        return key, _split_csv(value)
+    return key, value
+
+# Shared by the --version action and its fast path in __main__
+_VERSION_TEXT = 'v0.1.2 by 0xb0rn3'
+
+@functools.lru_cache(maxsize=1)
 def setup_argument_parser() -> argparse.ArgumentParser:
     """Setup command line argument parser"""
     parser = argparse.ArgumentParser(
@@ -1177,7 +1814,11 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     # Core arguments
     parser.add_argument('-u', '--url', help='YouTube or compatible URL (video, playlist, channel)')
     parser.add_argument('--batch', help='Path to a text file containing URLs to download (one per line)')
-    parser.add_argument('--info', metavar="URL", help='Get media information as JSON and exit (ignores download options)')
+    parser.add_argument('--concurrency', type=_positive_int, metavar='N',
+                        help='Number of batch URLs downloaded at the same time (default: from config or 3)')
+    parser.add_argument('--info', nargs='+', metavar="URL",
+                        help='Get media information as JSON and exit (ignores download options).\n'
+                             'Several URLs are fetched in parallel and printed as a JSON list')
     
     # Output and Formatting (can be overridden by presets)
     parser.add_argument('-o', '--output', help='Output directory (default: from config or ~/Downloads/YtDorn)')
@@ -1186,11 +1827,12 @@ def setup_argument_parser() -> argparse.ArgumentParser:
 
     # Content Selection
     parser.add_argument('--extract-audio', action='store_true', help='Extract audio only (implies -f bestaudio)')
-    parser.add_argument('--audio-format', help='Audio format for extraction (e.g., mp3, m4a, wav, opus)')
+    parser.add_argument('--audio-format', choices=_AUDIO_CODECS, metavar='{' + ','.join(_AUDIO_CODECS) + '}',
+                        help='Audio format for extraction')
     parser.add_argument('--audio-quality', help='Audio quality for extraction (e.g., 192 for mp3, 0 for best VBR)')
     parser.add_argument('--subtitles', action='store_true', help='Download subtitles')
     parser.add_argument('--auto-subtitles', action='store_true', help='Include auto-generated subtitles if manual are missing')
-    parser.add_argument('--subtitle-langs', default='en', help='Comma-separated subtitle languages (e.g., en,es,ja)')
+    parser.add_argument('--subtitle-langs', type=_split_csv, default='en', help='Comma-separated subtitle languages (e.g., en,es,ja)')
     parser.add_argument('--embed-subs', action='store_true', help='Embed subtitles into media file (requires ffmpeg)')
     parser.add_argument('--thumbnail', action='store_true', help='Download thumbnail image')
     parser.add_argument('--embed-thumbnail', action='store_true', help='Embed thumbnail into media file (requires ffmpeg)')
@@ -1198,185 +1840,248 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     parser.add_argument('--description-file', action='store_true', help='Write video description to a .description file')
 
     # Playlist specific (can be overridden by presets)
-    parser.add_argument('--playlist-items', help='Specific items to download from a playlist (e.g., "1,3,5-7")')
+    parser.add_argument('--playlist-items', type=_playlist_items_arg, help='Specific items to download from a playlist (e.g., "1,3,5-7")')
     parser.add_argument('--no-playlist', action='store_true', help='If URL is a playlist, download only the video specified by URL (not the whole playlist)')
 
     # Configuration and Utility
     parser.add_argument('--preset', help='Use a configuration preset for download options (see --list-presets)')
     parser.add_argument('--list-presets', action='store_true', help='List available presets from config and exit')
-    parser.add_argument('--config', nargs='*', help="Set default config key=value pairs (e.g., default_output_dir=/path/to/my/videos)")
+    parser.add_argument('--config', nargs='*', type=_parse_config_item, metavar='KEY=VALUE', help="Set default config key=value pairs (e.g., default_output_dir=/path/to/my/videos)")
     parser.add_argument('--reset-config', action='store_true', help='Reset configuration to default values')
     
     parser.add_argument('--quiet', '-q', action='store_true', help='Quiet mode (minimal output, overrides interactive spinner/progress)')
-    parser.add_argument('--version', action='version', version=f'%(prog)s v0.1.2 by 0xb0rn3')
+    parser.add_argument('--version', action='version', version=f'%(prog)s {_VERSION_TEXT}')
 
     return parser
 
-def run_cli_mode(args: argparse.Namespace, ui: ModernUI, downloader: SuperDownloader):
-    """Run in command line mode with arguments"""
+# Markers of playlist/channel URLs, matched in one scan
+_PLAYLIST_URL_RE = re.compile(r'playlist\?list=|/playlist/|/channel/|/c/')
+
+def _is_likely_playlist(url: Optional[str]) -> bool:
+    """Guess from the URL alone whether it points at a playlist/channel"""
+    # Simplistic; ideally we'd fetch info first even in CLI if not too slow
+    return bool(url and _PLAYLIST_URL_RE.search(url))
+
+# (argparse dest, download option key) for CLI overrides.
+# Only truthy argument values override config/preset options.
+_CLI_OPTION_MAP: Tuple[Tuple[str, str], ...] = (
+    ('output', 'output_dir'),
+    ('format', 'format'),
+    ('output_template', 'output_template'), # Full path if provided
+    ('extract_audio', 'extract_audio'),
+    ('audio_format', 'audio_format'),
+    ('audio_quality', 'audio_quality'),
+    ('subtitles', 'subtitles'),
+    ('auto_subtitles', 'auto_subtitles'), # Works if subtitles is true
+    ('subtitle_langs', 'subtitle_langs'), # Already a list via _split_csv
+    ('embed_subs', 'embed_subs'),
+    ('thumbnail', 'thumbnail'),
+    ('embed_thumbnail', 'embed_thumbnail'),
+    ('metadata_json', 'metadata_json'),
+    ('description_file', 'description_file'),
+    ('playlist_items', 'playlist_items'),
+    ('no_playlist', 'no_playlist'),
+    ('concurrency', 'concurrency'),
+)
+# Short quality names accepted by -f and preset 'format' values; other values go to yt-dlp unchanged
+_CLI_FORMAT_MAP: Dict[str, str] = {
+    '1080p': _FORMAT_STRINGS['mp4_1080p'],
+    '720p': _FORMAT_STRINGS['mp4_720p'],
+    '480p': 'bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[height<=480][ext=mp4]',
+    'mp4_1080p': _FORMAT_STRINGS['mp4_1080p'],
+    'mp4_720p': _FORMAT_STRINGS['mp4_720p'],
+    'audio': 'bestaudio/best',
+    'mp3': 'bestaudio/best', # Converted by the audio extraction post-processor
+}
+_CLI_AUDIO_FORMAT_KEYS = frozenset({'audio', 'mp3'})
+
+_CLI_OPTION_KEYS = tuple(key for _, key in _CLI_OPTION_MAP)
+_get_cli_option_args = operator.attrgetter(*(dest for dest, _ in _CLI_OPTION_MAP)) # All values in one call
+
+def run_cli_mode(args: argparse.Namespace, ui: Optional[ModernUI] = None,
+                 downloader: Optional[SuperDownloader] = None):
+    """Run in command line mode with arguments
+
+    The UI and downloader are only created once a branch needs them, so config
+    and preset listing commands stay cheap.
+    """
     config = ConfigManager.load_config()
 
     if args.reset_config:
         default_cfg = ConfigManager._get_default_config()
         if ConfigManager.save_config(default_cfg):
-            print(f"{Colors.SUCCESS}Configuration reset to defaults and saved to {ConfigManager.CONFIG_FILE}{Colors.RESET}")
+            print(_OK_FMT % f"Configuration reset to defaults and saved to {ConfigManager.CONFIG_FILE}")
         else:
-            print(f"{Colors.ERROR}Failed to reset configuration.{Colors.RESET}")
+            print(_ERR_FMT % "Failed to reset configuration.")
         return
 
     if args.config:
         updated = False
-        for item in args.config:
-            key, sep, value = item.partition('=')
-            if sep:
-                # Try to intelligently convert value type for known config keys
-                if key in config and isinstance(config[key], bool): value = value.lower() in ['true', '1', 'yes']
-                elif key in config and isinstance(config[key], int): value = int(value)
-                elif key in config and isinstance(config[key], list) and isinstance(value, str): value = [v.strip() for v in value.split(',')]
-                
-                # For nested presets, e.g., presets.my_preset.format=newValue
-                keys = key.split('.')
+        prefix_cache: Dict[Tuple[str, ...], dict] = {(): config} # Parent dicts already walked in this run
+        cache_get, muted_fmt = prefix_cache.get, _MUTED_FMT # Locals for the loop below
+        for key, value in args.config: # Already split and coerced by _parse_config_item
+            # For nested presets, e.g., presets.my_preset.format=newValue
+            keys = tuple(key.split('.'))
+            parent = keys[:-1]
+            d = cache_get(parent)
+            if d is None:
                 d = config
-                for k_part in keys[:-1]:
-                    d = d.setdefault(k_part, {})
-                d[keys[-1]] = value
-                updated = True
-                print(f"{Colors.MUTED}Config: set {key} = {value}{Colors.RESET}")
-            else:
-                print(f"{Colors.WARNING}Invalid config format: {item}. Use key=value.{Colors.RESET}")
+                for i in range(len(parent)):
+                    prefix = parent[:i + 1]
+                    cached = cache_get(prefix)
+                    if cached is None:
+                        cached = prefix_cache[prefix] = d.setdefault(keys[i], {})
+                    d = cached
+            if keys[-1] in d and d[keys[-1]] == value:
+                print(muted_fmt % f"Config: {key} already {value}")
+                continue
+            d[keys[-1]] = value
+            updated = True
+            print(muted_fmt % f"Config: set {key} = {value}")
         if updated:
             ConfigManager.save_config(config)
-            print(f"{Colors.SUCCESS}Configuration updated and saved to {ConfigManager.CONFIG_FILE}{Colors.RESET}")
+            print(_OK_FMT % f"Configuration updated and saved to {ConfigManager.CONFIG_FILE}")
+        else:
+            print(_MUTED_FMT % "Configuration unchanged.")
         return # Exit after config change
 
 
     if args.list_presets:
-        print(f"{Colors.PRIMARY}{Colors.BOLD}Available Presets (from {ConfigManager.CONFIG_FILE}):{Colors.RESET}")
-        if not config.get('presets'):
-            print(f"{Colors.MUTED}  No presets found.{Colors.RESET}")
-            return
-        for name, settings in config['presets'].items():
-            print(f"\n  {Colors.SUCCESS}{name}{Colors.RESET}:")
-            for key, value in settings.items():
-                print(f"    {Colors.MUTED}{key}{Colors.RESET}: {Colors.PRIMARY}{value}{Colors.RESET}")
+        # Build the whole listing and write it once instead of one print per line
+        muted, primary, reset = Colors.MUTED, Colors.PRIMARY, Colors.RESET
+        parts = [f"{primary}{Colors.BOLD}Available Presets (from {ConfigManager.CONFIG_FILE}):{reset}"]
+        presets = config.get('presets')
+        if not presets:
+            parts.append(f"{muted}  No presets found.{reset}")
+        else:
+            for name, settings in presets.items():
+                parts.append(f"\n  {Colors.SUCCESS}{name}{reset}:")
+                parts.extend(f"    {muted}{key}{reset}: {primary}{value}{reset}" for key, value in settings.items())
+        sys.stdout.write("\n".join(parts) + "\n")
         return
 
+    downloader = downloader or _downloader()
+
     if args.info:
         spinner = ModernSpinner() if not args.quiet else None
-        if spinner: spinner.start(f"Fetching info for {args.info}...")
+        target = args.info[0] if len(args.info) == 1 else f"{len(args.info)} URLs"
+        if spinner: spinner.start(f"Fetching info for {target}...")
         try:
-            info = downloader.get_video_info(args.info)
+            if len(args.info) == 1:
+                info = downloader.get_video_info(args.info[0])
+            else: # Several URLs: fetch concurrently, print a JSON list in argument order
+                info = downloader.get_many_video_info(args.info)
             if spinner: spinner.stop()
-            # Output as JSON
-            try:
-                print(json.dumps(info, indent=2, ensure_ascii=False))
-            except TypeError: # Handle non-serializable items if any (e.g. datetime if not stringified)
-                # A simple way to handle non-serializable: convert to string
-                print(json.dumps(info, indent=2, default=str, ensure_ascii=False))
+            # default=str covers non-serializable items (e.g. datetime) up front since a retry
+            # after a partial write is not possible
+            out = getattr(sys.stdout, 'buffer', None)
+            if orjson and out is not None: # Serialized in one C call; info with all formats can be large
+                data = orjson.dumps(info, default=str,
+                                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+                sys.stdout.flush() # Keep ordering with anything already written as text
+                out.write(data)
+                out.flush()
+            else: # Stream JSON straight to stdout
+                json.dump(info, sys.stdout, indent=2, default=str, ensure_ascii=False)
+                sys.stdout.write('\n')
         except Exception as e:
-            if spinner: spinner.stop(f"{Colors.ERROR}Error fetching info: {str(e)}{Colors.RESET}")
+            if spinner: spinner.stop(_ERR_FMT % f"Error fetching info: {e}")
             else: print(f"Error: {str(e)}", file=sys.stderr)
             sys.exit(1)
         return
 
     # --- Prepare download options from CLI args and presets ---
-    cli_options: Dict[str, Any] = {}
-
-    # Start with config defaults
-    cli_options['output_dir'] = config.get('default_output_dir', str(Path.home() / "Downloads" / "YtDorn"))
-    cli_options['format'] = config.get('default_format', 'best')
-    # ... other defaults from config can be added here
+    # Precedence: CLI arguments > preset > config defaults
+    defaults: Dict[str, Any] = {
+        'output_dir': config.get('default_output_dir', _DEFAULT_DOWNLOADS_DIR),
+        'format': config.get('default_format', 'best'),
+        'concurrency': config.get('default_concurrency', 3),
+        # ... other defaults from config can be added here
+    }
 
-    # Apply preset if specified
+    # Apply preset if specified (no interactive menus involved)
+    preset_options: Dict[str, Any] = {}
     if args.preset:
         if args.preset in config.get('presets', {}):
-            cli_options.update(config['presets'][args.preset])
-            if not args.quiet: print(f"{Colors.INFO}Applied preset: {args.preset}{Colors.RESET}")
+            preset_options = SuperDownloader.create_options_from_preset(args.preset)
+            if not args.quiet: print(_INFO_FMT % f"Applied preset: {args.preset}")
         else:
-            print(f"{Colors.ERROR}Preset '{args.preset}' not found. Use --list-presets to see available ones.{Colors.RESET}", file=sys.stderr)
+            print(_ERR_FMT % f"Preset '{args.preset}' not found. Use --list-presets to see available ones.", file=sys.stderr)
             sys.exit(1)
 
-    # Override with direct CLI arguments
-    if args.output: cli_options['output_dir'] = args.output
-    if args.format: cli_options['format'] = args.format
-    if args.output_template: cli_options['output_template'] = args.output_template # Full path if provided
-    
-    if args.extract_audio: cli_options['extract_audio'] = True
-    if args.audio_format: cli_options['audio_format'] = args.audio_format
-    if args.audio_quality: cli_options['audio_quality'] = args.audio_quality
-    
-    if args.subtitles: cli_options['subtitles'] = True
-    if args.auto_subtitles: cli_options['auto_subtitles'] = True # Works if subtitles is true
-    if args.subtitle_langs: cli_options['subtitle_langs'] = [lang.strip() for lang in args.subtitle_langs.split(',')]
-    if args.embed_subs: cli_options['embed_subs'] = True
-    
-    if args.thumbnail: cli_options['thumbnail'] = True
-    if args.embed_thumbnail: cli_options['embed_thumbnail'] = True
-    
-    if args.metadata_json: cli_options['metadata_json'] = True
-    if args.description_file: cli_options['description_file'] = True
-    
-    if args.playlist_items: cli_options['playlist_items'] = args.playlist_items
-    if args.no_playlist: cli_options['no_playlist'] = True
-    
+    # Direct CLI arguments
+    cli_override: Dict[str, Any] = {
+        key: value for key, value in zip(_CLI_OPTION_KEYS, _get_cli_option_args(args)) if value
+    }
+
+    # Later layers win; the options below are adjusted in place
+    cli_options: Dict[str, Any] = {**defaults, **preset_options, **cli_override}
+
+    format_key = cli_options['format']
+    cli_options['format'] = _CLI_FORMAT_MAP.get(format_key, format_key)
+    if format_key in _CLI_AUDIO_FORMAT_KEYS:
+        cli_options['extract_audio'] = True
+        cli_options.setdefault('audio_format', 'mp3' if format_key == 'mp3' else 'best') # --audio-format wins
+    elif cli_options.get('extract_audio') and 'format' not in cli_override and 'format' not in preset_options:
+        cli_options['format'] = 'bestaudio/best' # --extract-audio implies bestaudio unless a format was asked for
+
     if args.quiet:
         # Suppress progress hooks if quiet mode is on for CLI
         downloader.download_hook = lambda d: None # type: ignore
 
     # Ensure output directory is resolved and output_template is constructed correctly
-    cli_options['output_dir'] = str(Path(cli_options['output_dir']).resolve())
-    if 'output_template' not in cli_options or not Path(cli_options['output_template']).is_absolute():
-        # Default filename pattern if not fully specified by template or preset
-        default_filename_pattern = "%(title).150s [%(id)s].%(ext)s"
-        # Check if it's a playlist URL for playlist-specific pattern if not overridden by preset
-        # This check is simplistic here; ideally, we'd fetch info first even in CLI if not too slow.
-        is_likely_playlist = False
-        if args.url and ('playlist?list=' in args.url or '/playlist/' in args.url or '/channel/' in args.url or '/c/' in args.url):
-            is_likely_playlist = True
-            if not cli_options.get('no_playlist'): # only if processing as playlist
-                 default_filename_pattern = "%(playlist_index)s - %(title).150s [%(id)s].%(ext)s"
-        
-        # If output_template was relative or just a pattern, join with output_dir
-        current_template_pattern = cli_options.get('output_template', default_filename_pattern)
-        cli_options['output_template'] = str(Path(cli_options['output_dir']) / current_template_pattern)
+    output_dir = cli_options['output_dir'] = os.path.abspath(os.path.expanduser(cli_options['output_dir']))
+    # Built once here, after CLI, preset and defaults are merged, so --no-playlist and -o apply to presets too
+    template = os.path.expanduser(cli_options.get('output_template') or '')
+    if not template:
+        # Default filename pattern, playlist-specific only if processing as playlist
+        template = "%(title).150s [%(id)s].%(ext)s"
+        if not cli_options.get('no_playlist') and _is_likely_playlist(args.url):
+            template = "%(playlist_index)s - %(title).150s [%(id)s].%(ext)s"
+
+    # A relative template or bare pattern goes under output_dir; join keeps an absolute one as is
+    cli_options['output_template'] = os.path.join(output_dir, template)
 
 
     # --- Execute Download ---
     # Create output directory
     try:
-        Path(cli_options['output_dir']).mkdir(parents=True, exist_ok=True)
+        os.makedirs(output_dir, exist_ok=True)
     except OSError as e:
-        print(f"{Colors.ERROR}Error creating output directory {cli_options['output_dir']}: {e}{Colors.RESET}", file=sys.stderr)
+        print(_ERR_FMT % f"Error creating output directory {output_dir}: {e}", file=sys.stderr)
         sys.exit(1)
 
     if args.batch:
-        if not Path(args.batch).is_file():
-            print(f"{Colors.ERROR}Batch file not found: {args.batch}{Colors.RESET}", file=sys.stderr)
+        if not os.path.isfile(args.batch):
+            print(_ERR_FMT % f"Batch file not found: {args.batch}", file=sys.stderr)
             sys.exit(1)
         if not args.quiet: print(f"{Colors.PRIMARY}Starting batch download from: {args.batch}{Colors.RESET}")
         # For CLI batch, we assume UI is not available for confirmations per item.
-        success = BatchDownloader.download_from_file(args.batch, cli_options, ui, downloader)
+        success = BatchDownloader.download_from_file(args.batch, cli_options, ui or _ui(), downloader)
         sys.exit(0 if success else 1)
 
     elif args.url:
         if not validate_url(args.url): # Basic check, yt-dlp will do the final validation
              # validate_url prints its own messages
              # sys.exit(1) # Commented out to allow yt-dlp to try anyway
-             if not args.quiet: print(f"{Colors.WARNING}URL validation failed, but attempting download with yt-dlp...{Colors.RESET}")
+             if not args.quiet: print(_WARN_FMT % "URL validation failed, but attempting download with yt-dlp...")
 
 
         if not args.quiet:
             print(f"{Colors.PRIMARY}Starting download for: {args.url}{Colors.RESET}")
             print(f"{Colors.MUTED}Options: {cli_options}{Colors.RESET}")
         
-        success = downloader.download_with_options(args.url, cli_options)
+        if _is_likely_playlist(args.url): # Entries are split across --concurrency workers
+            success = downloader.download_playlist(args.url, cli_options, cli_options.get('concurrency'))
+        else:
+            success = downloader.download_with_options(args.url, cli_options)
         
         if not args.quiet:
             if success:
-                print(f"\n{Colors.SUCCESS}✨ CLI Download process completed!{Colors.RESET}")
-                print(f"{Colors.INFO}📁 Files saved to (or attempted in): {Path(cli_options['output_dir']).resolve()}{Colors.RESET}")
+                print(_OK_FMT % "\n✨ CLI Download process completed!")
+                print(_INFO_FMT % f"📁 Files saved to (or attempted in): {output_dir}")
             else:
-                print(f"\n{Colors.WARNING}⚠️ CLI Download process finished with some issues.{Colors.RESET}")
+                print(_WARN_FMT % "\n⚠️ CLI Download process finished with some issues.")
         sys.exit(0 if success else 1)
 
     else: # No URL, batch, info, or list-presets given that would exit
@@ -1384,42 +2089,46 @@ def run_cli_mode(args: argparse.Namespace, ui: ModernUI, downloader: SuperDownlo
         # If it's reached, it means only optional flags like --quiet were given without a primary action.
         # The `if any(meaningful_args):` check before calling `run_cli_mode` handles this.
         # So, this `else` block is a fallback.
-        print(f"{Colors.ERROR}No action specified (URL, batch, info, list-presets). Use --help for options.{Colors.RESET}", file=sys.stderr)
+        print(_ERR_FMT % "No action specified (URL, batch, info, list-presets). Use --help for options.", file=sys.stderr)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    # Initialize UI and Downloader instances for both modes
-    # This helps if CLI mode still needs to show some UI elements or use downloader methods.
-    ui_instance = ModernUI()
-    downloader_instance = SuperDownloader()
-    
-    # Check if running in CLI mode (with arguments)
-    arg_parser = setup_argument_parser()
-    cli_args = arg_parser.parse_args()
-
-    # Determine if CLI mode should run based on provided arguments
-    # Meaningful args are those that specify an action, not just modifiers like --quiet
-    # or config-only changes like --reset-config / --config
-    action_args_present = cli_args.url or \
-                          cli_args.batch or \
-                          cli_args.info or \
-                          cli_args.list_presets
-    
-    config_action_args_present = cli_args.config or \
-                                 cli_args.reset_config
+    # Answer a bare --version without building the full parser
+    if sys.argv[1:] == ['--version']:
+        print(f"{os.path.basename(sys.argv[0])} {_VERSION_TEXT}")
+        sys.exit(0)
+
+    # Check if running in CLI mode (with arguments); a bare launch is interactive
+    # and never needs the parser
+    should_run_cli = False
+    if len(sys.argv) > 1:
+        arg_parser = setup_argument_parser()
+        cli_args = arg_parser.parse_args()
+
+        # Determine if CLI mode should run based on provided arguments
+        # Meaningful args are those that specify an action, not just modifiers like --quiet
+        # or config-only changes like --reset-config / --config
+        action_args_present = cli_args.url or \
+                              cli_args.batch or \
+                              cli_args.info or \
+                              cli_args.list_presets
+
+        config_action_args_present = cli_args.config or \
+                                     cli_args.reset_config
 
-    should_run_cli = action_args_present or config_action_args_present
+        should_run_cli = action_args_present or config_action_args_present
 
     try:
         if should_run_cli:
-            # Check dependencies even for CLI mode, unless it's just for --version or --help (handled by argparse)
-            # For --list-presets or config changes, dependencies might not be strictly needed, but yt-dlp presence is good.
-            if action_args_present and not (cli_args.info and cli_args.list_presets): # Skip dep check for list-presets and info for now
-                 if not DependencyManager.install_missing_dependencies(ModernSpinner(style='dots')): # Use a basic spinner for CLI
-                    # Errors printed by the method
-                    sys.exit(1)
-            run_cli_mode(cli_args, ui_instance, downloader_instance)
+            # Only actual downloads need the full dependency check (yt-dlp + ffmpeg).
+            # --info only touches the yt-dlp extractor and reports its own import error;
+            # --list-presets and config changes need nothing at all.
+            needs_deps = bool(cli_args.url or cli_args.batch)
+            if needs_deps and not DependencyManager.install_missing_dependencies(_spinner()):
+                # Errors printed by the method
+                sys.exit(1)
+            run_cli_mode(cli_args)
         else:
             # No meaningful CLI arguments provided, run interactive mode
             main() # main() uses global ui, spinner, downloader